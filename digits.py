@@ -0,0 +1,64 @@
+# digits.py
+# Pre-rendered 8x8 and 16x16 digit glyphs for counters that redraw every frame
+
+import framebuf
+
+DOT = 10  # Glyph index of "."
+
+# "0123456789." rendered once with the built-in font, one 8-byte column
+# strip per glyph in MONO_VLSB (the same layout as the OLED buffer)
+_GLYPHS = bytearray(11 * 8)
+_strip = framebuf.FrameBuffer(_GLYPHS, 11 * 8, 8, framebuf.MONO_VLSB)
+_strip.text("0123456789.", 0, 0, 1)
+del _strip
+_GLYPH_FBS = [
+    framebuf.FrameBuffer(memoryview(_GLYPHS)[i * 8:i * 8 + 8], 8, 8, framebuf.MONO_VLSB)
+    for i in range(11)
+]
+
+
+def _scaled_digit(i):
+    """Digit i from the 8x8 strip blown up 2x into its own 16x16 FrameBuffer"""
+    fb = framebuf.FrameBuffer(bytearray(32), 16, 16, framebuf.MONO_VLSB)
+    for gx in range(8):
+        col = _GLYPHS[i * 8 + gx]
+        for gy in range(8):
+            if (col >> gy) & 1:
+                fb.fill_rect(gx * 2, gy * 2, 2, 2, 1)
+    return fb
+
+
+# 16x16 digits for readouts that need to be legible at a glance
+_BIG_FBS = [_scaled_digit(i) for i in range(10)]
+
+
+def draw_glyph(fbuf, index, x, y):
+    """Blit glyph `index` (0-9 or DOT) at x, y; unset pixels are left alone"""
+    fbuf.blit(_GLYPH_FBS[index], x, y, 0)
+
+
+def _draw(fbuf, glyphs, cell, n, x, y, width, zero_pad):
+    end = x + width * cell
+    cx = end - cell
+    blit = fbuf.blit
+    while cx >= x:
+        blit(glyphs[n % 10], cx, y, 0)
+        n //= 10
+        cx -= cell
+        if not n and not zero_pad:
+            break
+    return end
+
+
+def draw_number(fbuf, n, x, y, width, zero_pad=False):
+    """Draw non-negative n right-aligned in `width` 8px cells starting at x.
+
+    Leading cells are left untouched (or drawn as 0 with zero_pad), so clear
+    the field first. Returns the x just past the field.
+    """
+    return _draw(fbuf, _GLYPH_FBS, 8, n, x, y, width, zero_pad)
+
+
+def draw_big_number(fbuf, n, x, y, width, zero_pad=False):
+    """draw_number() with 16x16 digits in 16px cells"""
+    return _draw(fbuf, _BIG_FBS, 16, n, x, y, width, zero_pad)
@@ -6,8 +6,27 @@ Uses '.' for 0 (black) and '#' for 1 (white).
 """
 
 from PIL import Image
+import numpy as np
 import sys
 
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
+
+if njit is not None:
+    @njit(cache=True, boundscheck=False)
+    def _render(arr, thr, out):
+        """Write '#'/'.' rows plus newline terminators into out (H x W+1)."""
+        height, width = arr.shape
+        for y in range(height):
+            for x in range(width):
+                out[y, x] = 35 if arr[y, x] > thr else 46
+            out[y, width] = 10
+else:
+    _render = None
+
 
 def image_to_ascii(image_path, target_size=(64, 64), threshold=128):
     """
@@ -31,23 +50,23 @@ def image_to_ascii(image_path, target_size=(64, 64), threshold=128):
         # Convert to grayscale
         img = img.convert('L')
         
-        # Convert to monochrome (1-bit)
-        # Pixels above threshold become white (1), below become black (0)
-        img = img.point(lambda x: 255 if x > threshold else 0, mode='1')
+        gray = np.asarray(img, dtype=np.uint8)
         
-        # Build ASCII representation
-        ascii_art = []
-        width, height = img.size
+        if _render is not None:
+            # Compiled kernel (fast path for batch conversions)
+            height, width = gray.shape
+            out = np.empty((height, width + 1), dtype=np.uint8)
+            _render(gray, threshold, out)
+            # Drop the trailing newline of the last row
+            return out.tobytes()[:-1].decode('ascii')
         
-        for y in range(height):
-            row = []
-            for x in range(width):
-                pixel = img.getpixel((x, y))
-                # pixel is either 0 (black) or 255/True (white) in mode '1'
-                row.append('#' if pixel else '.')
-            ascii_art.append(''.join(row))
+        # Threshold the whole image at once
+        # Pixels above threshold become white ('#'), below become black ('.')
+        chars = np.where(gray > threshold, np.uint8(ord('#')), np.uint8(ord('.')))
         
-        return '\n'.join(ascii_art)
+        # Build ASCII representation, one row per line
+        rows = b'\n'.join(chars[y].tobytes() for y in range(chars.shape[0]))
+        return rows.decode('ascii')
     
     except FileNotFoundError:
         print(f"Error: Image file '{image_path}' not found.")
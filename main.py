@@ -1,9 +1,19 @@
 from machine import Pin, I2C, RTC
 import time
+import random
 import network
-import urequests
+import socket
+import gc
+import array
+import uasyncio as asyncio
 import ssd1306
+import framebuf
+import micropython
 import _thread
+try:
+    import ntptime
+except ImportError:
+    ntptime = None
 from menu import Menu
 import minigame_a
 import minigame_b
@@ -30,118 +40,32 @@ time.sleep(1)
 if USE_HARDWARE_ENCODER:
     try:
         print("Using hardware-based rotary encoder (ESP32 PCNT)")
-        # Import directly from the library module placed on the device
-        from rotary_irq_esp import RotaryIRQ
-        # Adapter to match the polling encoder API (read/reset)
-        class RotaryEncoder:
-            def __init__(
-                self,
-                pin_a_id,
-                pin_b_id,
-                button_pin_id,
-                step_debounce_ms=1,
-                button_debounce_ms=35,
-                delta_cap=1,
-            ):
-                # Hardware rotary (unbounded range)
-                self.rotary = RotaryIRQ(
-                    pin_num_clk=pin_a_id,
-                    pin_num_dt=pin_b_id,
-                    min_val=0,
-                    max_val=1000000,
-                    reverse=False,
-                    range_mode=RotaryIRQ.RANGE_UNBOUNDED,
-                    pull_up=True,
-                )
-                # Button (active-low)
-                self.button = Pin(button_pin_id, Pin.IN, Pin.PULL_UP)
-                self._button_debounce_ms = button_debounce_ms
-                self._delta_cap = delta_cap
-                self._button_clicked = False
-                self._button_press_time = None
-                # Attach IRQ for button clicks
-                self.button.irq(
-                    trigger=Pin.IRQ_FALLING | Pin.IRQ_RISING,
-                    handler=self._button_irq,
-                )
-                # Track last value for delta computation
-                initial_value = self.rotary.value()
-                self._last_value = initial_value if initial_value is not None else 0
-            
-            def _button_irq(self, pin):
-                import time as _t
-                current = pin.value()
-                now = _t.ticks_ms()
-                if current == 0:
-                    self._button_press_time = now
-                else:
-                    if self._button_press_time is not None:
-                        if _t.ticks_diff(now, self._button_press_time) >= self._button_debounce_ms:
-                            self._button_clicked = True
-                    self._button_press_time = None
-            
-            def update(self):
-                # Hardware counts pulses; nothing to do here
-                pass
-            
-            def read(self):
-                current_value = self.rotary.value()
-                if current_value is None:
-                    current_value = 0
-                if self._last_value is None:
-                    self._last_value = current_value
-                delta = current_value - self._last_value
-                self._last_value = current_value
-                # Cap delta to ±delta_cap
-                if delta > self._delta_cap:
-                    delta = self._delta_cap
-                elif delta < -self._delta_cap:
-                    delta = -self._delta_cap
-                clicked = self._button_clicked
-                self._button_clicked = False
-                return delta, clicked
-            
-            def reset(self):
-                try:
-                    # RotaryIRQ.reset() resets to min_val
-                    self.rotary.reset()
-                except Exception:
-                    try:
-                        self.rotary.set(value=0)
-                    except Exception:
-                        pass
-                v = self.rotary.value()
-                self._last_value = v if v is not None else 0
-                self._button_clicked = False
-                self._button_press_time = None
-        
-        # Provide a no-op polling loop for API compatibility
-        def encoder_polling_loop(encoder, poll_frequency_hz=1000):
-            import time
-            poll_interval_ms = int(1000 / poll_frequency_hz)
-            print("Encoder polling thread started (hardware PCNT mode) - %dHz" % poll_frequency_hz)
-            while True:
-                time.sleep_ms(poll_interval_ms)
+        from rotary_encoder_irq import RotaryEncoderIRQ as RotaryEncoder
     except ImportError as e:
-        print("WARNING: Hardware encoder library not found!")
-        print("Install with: mip.install('github:miketeachman/micropython-rotary')")
+        print("WARNING: Hardware encoder unavailable:", e)
         print("Falling back to polling encoder...")
-        from rotary_encoder import RotaryEncoder, encoder_polling_loop
+        from rotary_encoder import RotaryEncoder
 else:
     print("Using polling-based rotary encoder")
-    from rotary_encoder import RotaryEncoder, encoder_polling_loop
+    from rotary_encoder import RotaryEncoder
 
 # ========== CONFIGURATION ==========
 
 # I2C pins
 I2C_SDA = 21
 I2C_SCL = 22
+# Optional separate bus for the HTU21D (e.g. 25/26). Leave as None to share
+# the OLED bus; a second bus lets the OLED stay at 1 MHz without clocking
+# down for every sensor transfer
+SENSOR_I2C_SDA = None
+SENSOR_I2C_SCL = None
 
 # Rotary encoder pins (GPIO numbers)
 # Use GPIO18/19 for A/B to avoid bootstrapping pins; button on GPIO23.
 ROTARY_PIN_A = 18
 ROTARY_PIN_B = 19
 ROTARY_BUTTON_PIN = 23
+ENCODER_POLL_HZ = 1000
 
 # Menu timings (milliseconds)
 MENU_IDLE_TIMEOUT_MS = 6000
@@ -155,47 +79,156 @@ RENDER_INTERVAL_MS = (1000 + TARGET_FPS - 1) // TARGET_FPS  # Ceiling division t
 SENSOR_UPDATE_INTERVAL_MS = 2000  # How often to refresh indoor sensor readings
 MOOD_CHANGE_INTERVAL = 5 * 60 * 1000  # 5 minutes in ms
 WEATHER_UPDATE_INTERVAL = 10 * 60 * 1000  # 10 minutes in ms
+LOOP_SLEEP_MS = 30  # Idle time per main-loop pass so the SoC isn't spinning
+MAX_SLEEP_MS = 100  # Longest main-loop sleep when no deadline is closer (clock blink)
+
+# Idle screen layout (pixels)
+PET_X = (128 - PET_W) // 2  # Pet sprite centered
+PET_Y = 0
+# Right-align: 128 pixels wide, each char is 8 pixels, "AM"/"PM" is 2 chars = 16 pixels + 1 spacing
+PERIOD_X = 128 - 18
+ICON_Y = 10
+HOUSE_X = 0
+SUN_X = 128 - ICON_W - 2  # 2px margin: the sun's right edge gets cut off flush against the panel edge
+LEFT_X = 0
+RIGHT_X = 98
+TEMP_Y = 48
+HUM_Y = 56
+STATUS_Y = TEMP_Y  # Top of the pre-rendered status strip (16 rows)
+RAIN_CONDITIONS = ("Rain", "Drizzle", "Thunderstorm")
 
 # ========== HARDWARE SETUP ==========
-i2c = I2C(0, scl=Pin(I2C_SCL), sda=Pin(I2C_SDA), freq=800_000)
+I2C_FREQ = 1_000_000  # Fast-mode plus for the OLED refresh
+OLED_COL_OFFSET = 2  # SH1106-style panel shows RAM columns 2..129; use 0 for a true SSD1306
+SENSOR_I2C_FREQ = 400_000  # HTU21D is only rated for fast mode
+i2c = I2C(0, scl=Pin(I2C_SCL), sda=Pin(I2C_SDA), freq=I2C_FREQ)
 
 # Scan I2C bus to verify devices
 print("I2C scan:", [hex(addr) for addr in i2c.scan()])
 
 time.sleep_ms(25)  # Let I2C settle
-oled = ssd1306.SSD1306_I2C(128, 64, i2c, addr=0x3c)
+oled = ssd1306.SSD1306_I2C(128, 64, i2c, addr=0x3c, col_offset=OLED_COL_OFFSET)
 
 
 # ========== HTU21D SENSOR ==========
 class HTU21D:
-    """HTU21D temperature/humidity sensor driver with proper bit masking"""
-    def __init__(self, i2c, addr=0x40):
+    """HTU21D temperature/humidity sensor driver with proper bit masking.
+
+    Measurements are split into start_*() / try_read_*() so callers can keep
+    working while the sensor converts instead of sleeping on it.
+    """
+    # First read attempt at the typical conversion time; until the result is
+    # ready the sensor NACKs the read, so poll again every RETRY_MS
+    TEMP_WAIT_MS = 44  # Typical at 14-bit resolution (max 50)
+    HUMIDITY_WAIT_MS = 14  # Typical at 12-bit resolution (max 16)
+    RETRY_MS = 2
+    MAX_RETRIES = 10  # Well past the datasheet max; anything later is a bus fault
+
+    def __init__(self, i2c, addr=0x40, freq=None, bus_freq=None):
         self.i2c = i2c
         self.addr = addr
+        # When set, the shared bus is clocked down to freq for each sensor
+        # transfer and restored to bus_freq afterwards
+        self._freq = freq
+        self._bus_freq = bus_freq
+        self._ready_at = 0  # ticks_ms deadline for the conversion in flight
+        self._retries = 0
     
-    def read_temperature(self):
-        """Return temperature in Celsius"""
-        self.i2c.writeto(self.addr, b'\xF3')  # Trigger temp measurement (no hold)
-        time.sleep_ms(50)  # Wait for measurement (max 50ms at 14-bit resolution)
-        data = self.i2c.readfrom(self.addr, 3)
+    def _transfer(self, op, arg):
+        if not self._freq:
+            return op(self.addr, arg)
+        self.i2c.init(freq=self._freq)
+        try:
+            return op(self.addr, arg)
+        finally:
+            self.i2c.init(freq=self._bus_freq)
+    
+    def _read_raw(self):
+        data = self._transfer(self.i2c.readfrom, 3)
         # Mask out status bits (2 LSBs) before calculation
-        raw = (data[0] << 8) | (data[1] & 0xFC)
-        temp_c = -46.85 + (175.72 * raw / 65536.0)
-        return temp_c
+        return (data[0] << 8) | (data[1] & 0xFC)
+    
+    def _poll_raw(self, now):
+        """Return the raw reading once the conversion is done, else None"""
+        if not self._ready(now):
+            return None
+        try:
+            return self._read_raw()
+        except OSError:
+            self._retries += 1
+            if self._retries > self.MAX_RETRIES:
+                raise
+            self._ready_at = time.ticks_add(time.ticks_ms(), self.RETRY_MS)
+            return None
+    
+    def ms_until_ready(self, now):
+        """Milliseconds until the next read attempt is due (0 if due now)"""
+        return max(0, time.ticks_diff(self._ready_at, now))
+    
+    def _arm(self, wait_ms):
+        self._ready_at = time.ticks_add(time.ticks_ms(), wait_ms)
+        self._retries = 0
+    
+    def _ready(self, now=None):
+        if now is None:
+            now = time.ticks_ms()
+        return time.ticks_diff(now, self._ready_at) >= 0
+    
+    def start_temperature(self):
+        """Trigger a temperature conversion (no hold master)"""
+        self._transfer(self.i2c.writeto, b'\xF3')
+        self._arm(self.TEMP_WAIT_MS)
+    
+    def try_read_temperature(self, now=None):
+        """Return temperature in hundredths of a degree Celsius, or None if
+        the conversion isn't done yet"""
+        raw = self._poll_raw(now)
+        if raw is None:
+            return None
+        # -46.85 + 175.72 * raw / 2^16, in integer hundredths
+        return ((17572 * raw) >> 16) - 4685
+    
+    def start_humidity(self):
+        """Trigger a humidity conversion (no hold master)"""
+        self._transfer(self.i2c.writeto, b'\xF5')
+        self._arm(self.HUMIDITY_WAIT_MS)
+    
+    def try_read_humidity(self, now=None):
+        """Return relative humidity in hundredths of a percent, or None if
+        the conversion isn't done yet"""
+        raw = self._poll_raw(now)
+        if raw is None:
+            return None
+        # -6 + 125 * raw / 2^16, in integer hundredths
+        rh = ((12500 * raw) >> 16) - 600
+        return max(0, min(10000, rh))
+    
+    def read_temperature(self):
+        """Return temperature in hundredths of a degree Celsius (blocking)"""
+        self.start_temperature()
+        time.sleep_ms(self.TEMP_WAIT_MS)
+        value = self.try_read_temperature()
+        while value is None:
+            time.sleep_ms(self.RETRY_MS)
+            value = self.try_read_temperature()
+        return value
     
     def read_humidity(self):
-        """Return relative humidity %"""
-        self.i2c.writeto(self.addr, b'\xF5')  # Trigger humidity measurement
-        time.sleep_ms(16)  # Wait for measurement (max 16ms at 12-bit resolution)
-        data = self.i2c.readfrom(self.addr, 3)
-        # Mask out status bits (2 LSBs) before calculation
-        raw = (data[0] << 8) | (data[1] & 0xFC)
-        rh = -6.0 + (125.0 * raw / 65536.0)
-        return max(0, min(100, rh))
-
+        """Return relative humidity in hundredths of a percent (blocking)"""
+        self.start_humidity()
+        time.sleep_ms(self.HUMIDITY_WAIT_MS)
+        value = self.try_read_humidity()
+        while value is None:
+            time.sleep_ms(self.RETRY_MS)
+            value = self.try_read_humidity()
+        return value
 
 try:
-    sensor = HTU21D(i2c)
+    if SENSOR_I2C_SDA is not None and SENSOR_I2C_SCL is not None:
+        sensor_i2c = I2C(1, scl=Pin(SENSOR_I2C_SCL), sda=Pin(SENSOR_I2C_SDA), freq=SENSOR_I2C_FREQ)
+        sensor = HTU21D(sensor_i2c)
+    else:
+        sensor = HTU21D(i2c, freq=SENSOR_I2C_FREQ, bus_freq=I2C_FREQ)
 except Exception as e:
     print("HTU21D init failed:", e)
     sensor = None
@@ -232,8 +265,10 @@ def connect_wifi():
 
 def sync_time_ntp():
     """Sync time with NTP server (requires WiFi)"""
+    if ntptime is None:
+        print("NTP sync failed: ntptime module not available")
+        return False
     try:
-        import ntptime
         ntptime.settime()
         print("Time synced via NTP")
         return True
@@ -243,7 +278,121 @@ def sync_time_ntp():
 
 
 # ========== OPENWEATHER ==========
-def fetch_outdoor_weather():
+OPENWEATHER_HOST = "api.openweathermap.org"
+_weather_ip = None  # Resolved once, reused for every fetch
+
+
+async def run_in_thread(fn, *args):
+    """Run a blocking call on a worker thread and await its result
+    without stalling the event loop (stand-in for run_in_executor).
+    """
+    result = [None, None]
+    done = _thread.allocate_lock()
+    done.acquire()
+
+    def worker():
+        try:
+            result[0] = fn(*args)
+        except Exception as e:
+            result[1] = e
+        finally:
+            done.release()
+
+    _thread.start_new_thread(worker, ())
+    while not done.acquire(0):
+        await asyncio.sleep_ms(20)
+    if result[1] is not None:
+        raise result[1]
+    return result[0]
+
+
+async def _weather_address():
+    """Resolve the OpenWeather host on first use and cache its IP"""
+    global _weather_ip
+    if _weather_ip is None:
+        # DNS lookup blocks for up to several seconds, so keep it off the UI
+        addr = await run_in_thread(socket.getaddrinfo, OPENWEATHER_HOST, 80)
+        _weather_ip = addr[0][-1][0]
+    return _weather_ip
+
+
+async def _http_exchange(request):
+    """Send request and return (status_line, body); headers are read line by
+    line and dropped so the body never has to be sliced out of a bigger copy.
+    """
+    reader, writer = await asyncio.open_connection(await _weather_address(), 80)
+    try:
+        writer.write(request)
+        await writer.drain()
+        status_line = await reader.readline()
+        while True:
+            line = await reader.readline()
+            if not line or line == b"\r\n":
+                break
+        chunks = []
+        while True:
+            chunk = await reader.read(512)
+            if not chunk:
+                break
+            chunks.append(chunk)
+    finally:
+        writer.close()
+        await writer.wait_closed()
+    body = chunks[0] if len(chunks) == 1 else b"".join(chunks)
+    del chunks
+    return status_line, body
+
+
+async def http_get(path, timeout=10):
+    """Minimal HTTP/1.0 GET against the OpenWeather host; yields to the
+    event loop while waiting on the network.
+    Returns: (status_code, body_bytes)
+    """
+    global _weather_ip
+    request = ("GET %s HTTP/1.0\r\nHost: %s\r\nConnection: close\r\n\r\n" % (
+        path, OPENWEATHER_HOST
+    )).encode()
+    try:
+        status_line, body = await asyncio.wait_for(_http_exchange(request), timeout)
+    except (OSError, asyncio.TimeoutError):
+        # Cached address may be stale (a dead host usually just hangs until
+        # the timeout); resolve again once
+        _weather_ip = None
+        status_line, body = await asyncio.wait_for(_http_exchange(request), timeout)
+    parts = status_line.split()
+    if len(parts) < 2:
+        raise ValueError("Malformed HTTP response")
+    return int(parts[1]), body
+
+
+def _json_number(data, key, start=0):
+    """Return the number following key in raw JSON bytes, or None"""
+    pos = data.find(key, start) if start >= 0 else -1
+    if pos < 0:
+        return None
+    pos += len(key)
+    end = pos
+    while end < len(data) and data[end] not in b',}]':
+        end += 1
+    try:
+        return float(data[pos:end])
+    except ValueError:
+        return None
+
+
+def _json_string(data, key, start=0):
+    """Return the string value following key (which ends in the opening quote), or None"""
+    pos = data.find(key, start) if start >= 0 else -1
+    if pos < 0:
+        return None
+    pos += len(key)
+    end = data.find(b'"', pos)
+    if end < 0:
+        return None
+    return data[pos:end].decode()
+
+
+async def fetch_outdoor_weather():
     """Fetch outdoor temp, humidity, condition from OpenWeather API.
     Returns: (temp_c, humidity%, condition_string)
     """
@@ -251,47 +400,34 @@ def fetch_outdoor_weather():
         return None, None, None  # Skip if placeholder
     
     try:
-        url = "http://api.openweathermap.org/data/2.5/weather?lat=%s&lon=%s&appid=%s&units=metric" % (
+        path = "/data/2.5/weather?lat=%s&lon=%s&appid=%s&units=metric" % (
             OPENWEATHER_LAT, OPENWEATHER_LON, OPENWEATHER_API_KEY
         )
         print("Fetching weather for lat/lon:", OPENWEATHER_LAT, OPENWEATHER_LON)
-        response = urequests.get(url, timeout=10)
+        status_code, body = await http_get(path, timeout=10)
         
         # Check HTTP status
-        if response.status_code != 200:
-            print("Weather API error: HTTP", response.status_code)
-            if response.status_code == 401:
+        if status_code != 200:
+            print("Weather API error: HTTP", status_code)
+            if status_code == 401:
                 print("API key invalid or not activated. Check:")
                 print("  1. Key is correct: https://home.openweathermap.org/api_keys")
                 print("  2. Wait 10-120 min for new key activation")
                 print("  3. Free tier includes current weather API")
-            response.close()
-            return None, None, None
-        
-        # Parse JSON carefully
-        try:
-            data = response.json()
-        except ValueError as e:
-            print("Weather JSON parse error:", e)
-            print("Response text:", response.text[:200])
-            response.close()
-            return None, None, None
-        
-        response.close()
-        
-        # Check for API error response
-        if "cod" in data and str(data["cod"]) != "200":
-            print("Weather API returned error:", data.get("message", "Unknown"))
             return None, None, None
         
-        temp = None
-        humidity = None
-        condition = None
-        if "main" in data:
-            temp = data["main"].get("temp")
-            humidity = data["main"].get("humidity")
-        if "weather" in data and len(data["weather"]) > 0:
-            condition = data["weather"][0].get("main")
+        # Pull out only the three fields we display instead of building the
+        # whole JSON dict on the heap
+        # Both numbers live in the "main" object; anchoring there skips the
+        # coord/weather sections and misses cleanly when it's absent
+        main_at = body.find(b'"main":{')
+        temp = _json_number(body, b'"temp":', main_at)
+        humidity = _json_number(body, b'"humidity":', main_at)
+        condition = _json_string(body, b'"main":"', body.find(b'"weather"'))
+        if temp is None and humidity is None and condition is None:
+            print("Weather parse error, response text:", body[:200])
+        del body
+        gc.collect()
         
         print("Weather fetched: %s, %s°C, %s%%" % (condition, temp, humidity))
         return temp, humidity, condition
@@ -301,55 +437,128 @@ def fetch_outdoor_weather():
 
 
 # ========== SPRITE DRAWING ==========
-def blit_bitmap(buf, bw, bh, dx, dy, color=1):
-    """Draw 1-bit bitmap at (dx, dy)"""
-    row_bytes = (bw + 7) // 8
-    for y in range(bh):
+@micropython.viper
+def _to_vlsb(src: ptr8, dst: ptr8, w: int, h: int):
+    # Repack a row-major MSB-first bitmap into page-major (SSD1306) order
+    row_bytes = (w + 7) >> 3
+    y = 0
+    while y < h:
+        page = (y >> 3) * w
+        mask = 1 << (y & 7)
         base = y * row_bytes
-        for x in range(bw):
-            byte_index = base + (x // 8)
-            bit_pos = 7 - (x % 8)
-            on = (buf[byte_index] >> bit_pos) & 1
-            if on:
-                px = dx + x
-                py = dy + y
-                if 0 <= px < 128 and 0 <= py < 64:
-                    oled.pixel(px, py, color)
+        x = 0
+        while x < w:
+            if (src[base + (x >> 3)] >> (7 - (x & 7))) & 1:
+                dst[page + x] = dst[page + x] | mask
+            x += 1
+        y += 1
+
+
+@micropython.viper
+def _or_pages(src: ptr8, n: int, dst: ptr8, w: int):
+    # OR n bytes of a page-major sprite w columns wide into the OLED buffer;
+    # one byte is eight rows, so a page-aligned sprite is a plain OR per byte
+    i = 0
+    row = 0
+    while i < n:
+        x = 0
+        while x < w:
+            dst[row + x] = dst[row + x] | src[i + x]
+            x += 1
+        i += w
+        row += 128
+
+
+def _sprite_vlsb(buf, bw, bh):
+    """Convert a row-major MSB-first bitmap to a MONO_VLSB buffer"""
+    dst = bytearray(bw * ((bh + 7) >> 3))
+    _to_vlsb(buf, dst, bw, bh)
+    return dst
+
+
+def _sprite_fb(buf, bw, bh):
+    """Wrap a bitmap as a MONO_VLSB FrameBuffer matching the OLED layout"""
+    return framebuf.FrameBuffer(_sprite_vlsb(buf, bw, bh), bw, bh, framebuf.MONO_VLSB)
+
+
+# Pre-convert static sprites once; the pet is drawn by _or_pages(), not blit()
+HOUSE_FB = _sprite_fb(HOUSE_ICON, ICON_W, ICON_H)
+SUN_FB = _sprite_fb(SUN_ICON, ICON_W, ICON_H)
+MOOD_SPRITES = {
+    mood: [_sprite_vlsb(f, PET_W, PET_H) for f in frames]
+    for mood, frames in MOOD_FRAMES.items()
+}
+PET_BYTES = PET_W * ((PET_H + 7) >> 3)
+# PET_Y must be a multiple of 8 so sprite pages line up with OLED pages
+_pet_dst = memoryview(oled.buffer)[(PET_Y >> 3) * 128 + PET_X:]
+
+
+# Static backdrop (icons never move); render() starts each frame from a copy
+_BASE = bytearray(1024)
+_base_fb = framebuf.FrameBuffer(_BASE, 128, 64, framebuf.MONO_VLSB)
+_base_fb.blit(HOUSE_FB, HOUSE_X, ICON_Y, 0)
+_base_fb.blit(SUN_FB, SUN_X, ICON_Y, 0)
+del _base_fb
+STATUS_OFFSET = (STATUS_Y >> 3) * 128  # Status strip is whole pages at the bottom
 
 
 # ========== GAME STATE ==========
 current_mood = MOOD_HAPPY
 frame_idx = 0
-indoor_temp_c = None
-indoor_humidity = None
+current_frame = MOOD_SPRITES[MOOD_HAPPY][0]  # Resolved when mood/frame changes, not per render
+indoor_temp_x100 = None  # Hundredths of a degree Celsius
+indoor_humidity_x100 = None  # Hundredths of a percent
 outdoor_temp_c = None
 outdoor_humidity = None
 weather_condition = None  # "Rain" or "Clear"
+# Display strings cached when the readings change, not every frame
+indoor_temp_str = "--F"
+indoor_humidity_str = "--%"
+outdoor_temp_str = "--F"
+outdoor_humidity_str = "--%"
+last_minute = None
+time_str_colon = "--:--"
+time_str_blank = "--:--"
+time_period = ""
 manual_rain_mode = False  # Toggle rain overlay manually with button
-last_mood_change = 0
 last_weather_update = 0
-last_stat_decay = 0
+# Bottom status strip (temps/humidity), re-rendered only when a string changes
+_status_buf = bytearray(128 * 16 // 8)
+_status_fb = framebuf.FrameBuffer(_status_buf, 128, 16, framebuf.MONO_VLSB)
+# Redraw only when something visible changed
+_dirty = True
+_force_show = True
+_last_frame = bytearray(1024)
 
 STATE_IDLE = "idle"
 STATE_MENU = "menu"
 STATE_STATS = "stats"
 STATE_MESSAGE = "message"
 STATE_MINIGAME = "minigame"
+ui_state = STATE_IDLE  # Screen currently shown, mirrored from main_async()
 
 STAT_KEYS = ("Energy", "Hunger", "Health")
-stats_values = {
-    "Energy": 80,
-    "Hunger": 65,
-    "Health": 75,
-}
+STAT_INDEX = {key: idx for idx, key in enumerate(STAT_KEYS)}
+# Indexed by STAT_INDEX; values stay within STAT_MIN..STAT_MAX so a byte is enough
+stats_values = array.array("b", (80, 65, 75))
 STAT_MIN = 0
 STAT_MAX = 100
 STAT_DECAY_INTERVAL_MS = 120000  # 2 minutes
 STAT_DECAY_AMOUNT = 1
 
+# Non-blocking sensor read state
+SENSOR_IDLE = 0
+SENSOR_WAIT_TEMP = 1
+SENSOR_WAIT_HUMIDITY = 2
+_sensor_state = SENSOR_IDLE
+_pending_temp_x100 = None
+
 # Sensor calibration (adjust based on known accurate readings)
 TEMP_OFFSET_C = 0  # Temperature offset in Celsius
 HUMIDITY_OFFSET = 0 
+# Readings are integer hundredths, so apply the offsets in the same units
+_TEMP_OFFSET_X100 = int(TEMP_OFFSET_C * 100)
+_HUMIDITY_OFFSET_X100 = int(HUMIDITY_OFFSET * 100)
 
 
 def c_to_f(celsius):
@@ -359,6 +568,34 @@ def c_to_f(celsius):
     return celsius * 9.0 / 5.0 + 32.0
 
 
+def format_temp(celsius):
+    """Format a Celsius reading as whole Fahrenheit for the display"""
+    if celsius is None:
+        return "--F"
+    return "%dF" % int(c_to_f(celsius))
+
+
+def format_temp_x100(celsius_x100):
+    """Format hundredths of a degree Celsius as whole Fahrenheit"""
+    if celsius_x100 is None:
+        return "--F"
+    return "%dF" % ((celsius_x100 * 9) // 500 + 32)
+
+
+def format_humidity_x100(humidity_x100):
+    """Format hundredths of a percent relative humidity for the display"""
+    if humidity_x100 is None:
+        return "--%"
+    return "%d%%" % (humidity_x100 // 100)
+
+
+def format_humidity(humidity):
+    """Format a relative humidity reading for the display"""
+    if humidity is None:
+        return "--%"
+    return "%d%%" % int(humidity)
+
+
 def clamp(value, low, high):
     if value < low:
         return low
@@ -372,31 +609,37 @@ def clamp_stat(value):
 
 
 def get_stat(name):
-    return clamp_stat(stats_values.get(name, 0))
+    return stats_values[STAT_INDEX[name]]
 
 
 def set_stat(name, value):
-    stats_values[name] = clamp_stat(int(value))
+    stats_values[STAT_INDEX[name]] = clamp_stat(int(value))
 
 
 def adjust_stat(name, delta):
-    stats_values[name] = clamp_stat(stats_values.get(name, 0) + delta)
+    idx = STAT_INDEX[name]
+    stats_values[idx] = clamp_stat(stats_values[idx] + delta)
 
 
 def decay_stats(amount):
-    for key in STAT_KEYS:
-        stats_values[key] = clamp_stat(stats_values.get(key, 0) - amount)
+    for idx in range(len(stats_values)):
+        stats_values[idx] = clamp_stat(stats_values[idx] - amount)
+
+
+_TZ_SECONDS = TIMEZONE_OFFSET * 3600  # UTC -> local, applied to time.time()
 
 
-def get_time_string(show_colon=True):
+def get_time_string(show_colon=True, t=None):
     """Get current time as formatted string with optional blinking colon.
+    Pass an already-computed local time tuple as t to skip the lookup.
     Returns: (time_string, period_string) e.g., ("9:45" or "9 45", "AM")
     """
     try:
-        # Get current UTC time and apply timezone offset
-        utc_seconds = time.time()
-        local_seconds = utc_seconds + (TIMEZONE_OFFSET * 3600)
-        t = time.localtime(local_seconds)
+        if t is None:
+            # Get current UTC time and apply timezone offset
+            utc_seconds = time.time()
+            local_seconds = utc_seconds + _TZ_SECONDS
+            t = time.localtime(local_seconds)
         
         hour = t[3]  # 0-23
         minute = t[4]
@@ -423,58 +666,281 @@ def get_time_string(show_colon=True):
         return "--:--", ""
 
 
-def update_sensors():
-    """Read indoor temperature and humidity from HTU21D with calibration"""
-    global indoor_temp_c, indoor_humidity
-    if sensor:
-        try:
-            raw_temp = sensor.read_temperature()
-            raw_humidity = sensor.read_humidity()
-            indoor_temp_c = raw_temp + TEMP_OFFSET_C  # Apply temp calibration
-            indoor_humidity = max(0, min(100, raw_humidity + HUMIDITY_OFFSET))  # Apply humidity calibration (clamp 0-100%)
-        except Exception as e:
-            print("Sensor read error:", e)
-            indoor_temp_c = None
-            indoor_humidity = None
+def mark_dirty(state=None):
+    """Request a redraw on the next render tick; with a state, only if that
+    screen is the one showing"""
+    global _dirty
+    if state is None or state == ui_state:
+        _dirty = True
+
+
+def invalidate_display():
+    """Force the next show_if_changed() to push, e.g. after a minigame drew directly"""
+    global _force_show, _dirty
+    _force_show = True
+    _dirty = True
+
+
+@micropython.viper
+def _diff_bounds(cur: ptr8, prev: ptr8) -> int:
+    # Return packed (c0, c1, page_mask) of bytes that differ, or -1 if identical
+    c0 = 128
+    c1 = -1
+    mask = 0
+    i = 0
+    while i < 1024:
+        if cur[i] != prev[i]:
+            c = i & 127
+            mask = mask | (1 << (i >> 7))
+            if c < c0:
+                c0 = c
+            if c > c1:
+                c1 = c
+        i += 1
+    if mask == 0:
+        return -1
+    return (c0 << 16) | (c1 << 8) | mask
+
+
+def show_if_changed():
+    """Push only the changed columns of the pages that changed since the last frame sent"""
+    global _force_show
+    if _force_show:
+        oled.show()
+        _force_show = False
+    else:
+        if oled.buffer == _last_frame:
+            return
+        bounds = _diff_bounds(oled.buffer, _last_frame)
+        if bounds < 0:
+            return
+        c0 = bounds >> 16
+        c1 = (bounds >> 8) & 0xFF
+        mask = bounds & 0xFF
+        # One window per run of consecutive dirty pages, so e.g. the clock row
+        # and the status strip don't drag the untouched pages between them along
+        page = 0
+        while mask:
+            if mask & 1:
+                first = page
+                while mask & 2:
+                    mask >>= 1
+                    page += 1
+                oled.show_window(c0, c1, first, page)
+            mask >>= 1
+            page += 1
+    _last_frame[:] = oled.buffer
+
+
+def start_sensor_read():
+    """Kick off a new HTU21D sample if one isn't already in flight"""
+    global _sensor_state
+    if not sensor or _sensor_state != SENSOR_IDLE:
+        return
+    try:
+        sensor.start_temperature()
+        _sensor_state = SENSOR_WAIT_TEMP
+    except Exception as e:
+        print("Sensor read error:", e)
+        _publish_sensor_values(None, None)
 
 
-def update_weather():
-    """Fetch outdoor temp, humidity, and condition from OpenWeather"""
-    global outdoor_temp_c, outdoor_humidity, weather_condition, last_weather_update
+def _publish_sensor_values(temp_x100, humidity_x100):
+    global indoor_temp_x100, indoor_humidity_x100, indoor_temp_str, indoor_humidity_str
+    indoor_temp_x100 = temp_x100
+    indoor_humidity_x100 = humidity_x100
+    temp_str = format_temp_x100(temp_x100)
+    humidity_str = format_humidity_x100(humidity_x100)
+    if temp_str != indoor_temp_str or humidity_str != indoor_humidity_str:
+        indoor_temp_str = temp_str
+        indoor_humidity_str = humidity_str
+        refresh_status_bar()
+
+
+def update_sensors(now=None):
+    """Advance the non-blocking HTU21D read: IDLE -> WAIT_TEMP -> WAIT_HUMIDITY.
+    Returns immediately unless a conversion has just finished.
+    """
+    global _sensor_state, _pending_temp_x100
+    if not sensor or _sensor_state == SENSOR_IDLE:
+        return
     try:
-        outdoor_temp_c, outdoor_humidity, weather_condition = fetch_outdoor_weather()
+        if _sensor_state == SENSOR_WAIT_TEMP:
+            raw_temp = sensor.try_read_temperature(now)
+            if raw_temp is None:
+                return
+            _pending_temp_x100 = raw_temp + _TEMP_OFFSET_X100  # Apply temp calibration
+            sensor.start_humidity()
+            _sensor_state = SENSOR_WAIT_HUMIDITY
+        elif _sensor_state == SENSOR_WAIT_HUMIDITY:
+            raw_humidity = sensor.try_read_humidity(now)
+            if raw_humidity is None:
+                return
+            _sensor_state = SENSOR_IDLE
+            # Apply humidity calibration (clamp 0-100%)
+            _publish_sensor_values(_pending_temp_x100, max(0, min(10000, raw_humidity + _HUMIDITY_OFFSET_X100)))
+    except Exception as e:
+        print("Sensor read error:", e)
+        _sensor_state = SENSOR_IDLE
+        _publish_sensor_values(None, None)
+
+
+def refresh_status_bar():
+    """Re-draw the cached temperature/humidity strip blitted by render()"""
+    _status_fb.fill(0)
+    _status_fb.text(indoor_temp_str, LEFT_X, TEMP_Y - STATUS_Y, 1)
+    _status_fb.text(indoor_humidity_str, LEFT_X, HUM_Y - STATUS_Y, 1)
+    _status_fb.text(outdoor_temp_str, RIGHT_X, TEMP_Y - STATUS_Y, 1)
+    _status_fb.text(outdoor_humidity_str, RIGHT_X, HUM_Y - STATUS_Y, 1)
+    mark_dirty(STATE_IDLE)
+
+
+_weather_mbox = [None]  # Latest (temp_c, humidity, condition, ticks) from weather_task
+
+
+async def update_weather():
+    """Fetch outdoor temp, humidity, and condition from OpenWeather and post
+    the result for the UI loop to pick up"""
+    try:
+        temp_c, humidity, condition = await fetch_outdoor_weather()
     except Exception as e:
         print("Weather update error:", e)
-        outdoor_temp_c = None
-        outdoor_humidity = None
-        weather_condition = None
-    last_weather_update = time.ticks_ms()
+        temp_c = humidity = condition = None
+    # Single slot: a newer result simply replaces one the UI hasn't taken yet
+    _weather_mbox[0] = (temp_c, humidity, condition, time.ticks_ms())
+
+
+def apply_weather():
+    """Take the posted weather result, if any, and refresh what shows it"""
+    global outdoor_temp_c, outdoor_humidity, weather_condition, last_weather_update
+    global outdoor_temp_str, outdoor_humidity_str
+    update = _weather_mbox[0]
+    if update is None:
+        return
+    _weather_mbox[0] = None
+    outdoor_temp_c, outdoor_humidity, weather_condition, last_weather_update = update
+    temp_str = format_temp(outdoor_temp_c)
+    humidity_str = format_humidity(outdoor_humidity)
+    if temp_str != outdoor_temp_str or humidity_str != outdoor_humidity_str:
+        outdoor_temp_str = temp_str
+        outdoor_humidity_str = humidity_str
+        refresh_status_bar()
+    else:
+        mark_dirty(STATE_IDLE)  # Condition (rain overlay) may still have changed
+
+
+async def weather_task():
+    """Refresh outdoor weather every WEATHER_UPDATE_INTERVAL without stalling the UI"""
+    while True:
+        await update_weather()
+        await asyncio.sleep_ms(WEATHER_UPDATE_INTERVAL)
+
+
+def set_mood(mood):
+    """Switch mood, restart its animation and resolve the sprite to draw"""
+    global current_mood, frame_idx, current_frame
+    current_mood = mood
+    frame_idx = 0
+    current_frame = MOOD_SPRITES[mood][0]
+
+
+def advance_frame():
+    """Toggle to the other animation frame (all moods have 2 frames)"""
+    global frame_idx, current_frame
+    frame_idx ^= 1
+    current_frame = MOOD_SPRITES[current_mood][frame_idx]
+    mark_dirty(STATE_IDLE)
+
+
+def decay_tick():
+    decay_stats(STAT_DECAY_AMOUNT)
+    mark_dirty(STATE_STATS)
+
+
+_MOODS = (MOOD_HAPPY, MOOD_SAD, MOOD_BORED, MOOD_LOVE, MOOD_POUTING)
 
 
 def change_mood():
     """Change pet mood with 50% chance"""
-    global current_mood
-    import random
-    # 50% chance to actually change mood
-    if random.random() < 0.5:
-        moods = [MOOD_HAPPY, MOOD_SAD, MOOD_BORED, MOOD_LOVE, MOOD_POUTING]
-        current_mood = random.choice(moods)
+    # One draw covers both the coin flip (bit 0) and the pick (bits 1-3)
+    r = random.getrandbits(4)
+    if not r & 1:
+        # getrandbits is cheaper than choice(); reject 5..7 to keep it uniform
+        pick = r >> 1
+        while pick >= 5:
+            pick = random.getrandbits(3)
+        set_mood(_MOODS[pick])
+        mark_dirty(STATE_IDLE)
         print("Mood changed to:", current_mood)
     else:
         print("Mood change skipped (50% chance)")
 
 
-def draw_rain_overlay():
-    """Draw simple rain overlay (diagonal lines)"""
-    import random
+# ========== SCHEDULER ==========
+# Periodic work is a list of [deadline_ms, interval_ms, callback] entries;
+# the main loop only walks it once the earliest deadline has passed.
+def periodic_event(interval_ms, callback):
+    return [time.ticks_add(time.ticks_ms(), interval_ms), interval_ms, callback]
+
+
+def postpone_event(event, now=None):
+    """Restart an event's interval from now"""
+    if now is None:
+        now = time.ticks_ms()
+    event[0] = time.ticks_add(now, event[1])
+
+
+def run_due_events(events, now):
+    """Run every event whose deadline has passed; return the next deadline"""
+    next_due = None
+    for event in events:
+        if time.ticks_diff(now, event[0]) >= 0:
+            event[2]()
+            event[0] = time.ticks_add(now, event[1])
+        if next_due is None or time.ticks_diff(event[0], next_due) < 0:
+            next_due = event[0]
+    return next_due
+
+
+mood_event = periodic_event(MOOD_CHANGE_INTERVAL, change_mood)
+EVENTS = [
+    periodic_event(SENSOR_UPDATE_INTERVAL_MS, start_sensor_read),
+    mood_event,
+    periodic_event(STAT_DECAY_INTERVAL_MS, decay_tick),
+    periodic_event(FRAME_TIME, advance_frame),
+]
+
+
+def _set_px_fast(buf, x, y):
+    """Set one pixel in a 128-wide page-major (SSD1306 layout) buffer"""
+    buf[(y >> 3) * 128 + x] |= 1 << (y & 7)
+
+
+def _make_rain_sheet():
+    """Pre-draw one full-screen frame of rain into its own FrameBuffer"""
+    buf = bytearray(1024)
     for _ in range(19):  # 19 random raindrops
-        x = random.randint(0, 127)
-        y = random.randint(0, 63)
-        # Small diagonal line
-        for i in range(4):
-            px, py = x + i, y + i
-            if 0 <= px < 128 and 0 <= py < 64:
-                oled.pixel(px, py, 1)
+        # One PRNG call per drop: low byte -> x (0..127), high byte -> y (0..63)
+        r = random.getrandbits(16)
+        x = r & 0x7F
+        y = (r >> 8) & 0x3F
+        # Small diagonal line, clipped at the right/bottom edge
+        n = min(4, 128 - x, 64 - y)
+        for i in range(n):
+            _set_px_fast(buf, x + i, y + i)
+    return framebuf.FrameBuffer(buf, 128, 64, framebuf.MONO_VLSB)
+
+
+RAIN_SHEETS = 4  # Power of two; each sheet costs 1 KB of heap
+_RAIN_FB = [_make_rain_sheet() for _ in range(RAIN_SHEETS)]
+_rain_idx = 0
+
+
+def draw_rain_overlay():
+    """Draw simple rain overlay (diagonal lines) from the pre-drawn sheets"""
+    global _rain_idx
+    _rain_idx = (_rain_idx + 1) & (RAIN_SHEETS - 1)
+    oled.blit(_RAIN_FB[_rain_idx], 0, 0, 0)
 
 
 def is_rain_mode_enabled():
@@ -488,80 +954,64 @@ def toggle_rain_mode():
 
 def render():
     """Draw the full screen: pet + temps/humidity + weather overlay"""
-    oled.fill(0)
+    global last_minute, time_str_colon, time_str_blank, time_period
+    buf = oled.buffer
+    buf[:] = _BASE
+    # Indoor (left) and outdoor (right) temp and humidity, pre-rendered
+    buf[STATUS_OFFSET:] = _status_buf
     
     # Time display in upper left corner with blinking colon
     # Blink based on current second (on for even seconds, off for odd)
     try:
         # Apply timezone offset for proper local time display
         utc_seconds = time.time()
-        local_seconds = utc_seconds + (TIMEZONE_OFFSET * 3600)
-        second = time.localtime(local_seconds)[5]
-        show_colon = (second % 2) == 0
+        local_seconds = utc_seconds + _TZ_SECONDS
+        # Seconds within the minute don't need a localtime() call
+        show_colon = not (local_seconds & 1)
+        minute = local_seconds // 60
     except:
         show_colon = True
+        minute = None
     
-    time_str, period = get_time_string(show_colon)
+    # Only re-format the clock when the minute rolls over, sharing one
+    # localtime() result between both variants
+    if minute is None or minute != last_minute:
+        t = time.localtime(local_seconds) if minute is not None else None
+        time_str_colon, time_period = get_time_string(True, t)
+        time_str_blank, _ = get_time_string(False, t)
+        last_minute = minute
+    time_str = time_str_colon if show_colon else time_str_blank
+    period = time_period
     oled.text(time_str, 0, 0, 1)
     
     # AM/PM in upper right corner
     if period:
-        # Right-align: 128 pixels wide, each char is 8 pixels, "AM"/"PM" is 2 chars = 16 pixels + 1 spacing
-        oled.text(period, (128 - 18), 0, 1)
+        oled.text(period, PERIOD_X, 0, 1)
     
-    # Pet sprite centered
-    pet_x = (128 - PET_W) // 2
-    pet_y = 0
-    frames = MOOD_FRAMES[current_mood]
-    blit_bitmap(frames[frame_idx % len(frames)], PET_W, PET_H, pet_x, pet_y, 1)
+    # Pet sprite centered, OR'd page by page so unset pixels stay transparent
+    _or_pages(current_frame, PET_BYTES, _pet_dst, PET_W)
     
     # Rain overlay if actual weather is rainy OR manual rain mode enabled
-    show_rain = (weather_condition and weather_condition in ("Rain", "Drizzle", "Thunderstorm")) or manual_rain_mode
+    show_rain = weather_condition in RAIN_CONDITIONS or manual_rain_mode
     if show_rain:
         draw_rain_overlay()
     
-    # Weather icons (32x32) above temperatures
-    # House icon for indoor (left side)
-    blit_bitmap(HOUSE_ICON, ICON_W, ICON_H, 0, 10, 1)
-    # Sun icon for outdoor (right side)
-    blit_bitmap(SUN_ICON, ICON_W, ICON_H, 32+64-2, 10, 1)   #Have no idea why i need the minus 2px but the image gets cut off witout it...
-    
-    # Left side: Indoor temp and humidity
-    if indoor_temp_c is not None:
-        indoor_f = c_to_f(indoor_temp_c)
-        oled.text("%dF" % int(indoor_f), 0, 48, 1)
-    else:
-        oled.text("--F", 0, 48, 1)
-    
-    if indoor_humidity is not None:
-        oled.text("%d%%" % int(indoor_humidity), 0, 56, 1)
-    else:
-        oled.text("--%", 0, 56, 1)
-    
-    # Right side: Outdoor temp and humidity
-    if outdoor_temp_c is not None:
-        outdoor_f = c_to_f(outdoor_temp_c)
-        oled.text("%dF" % int(outdoor_f), 98, 48, 1)
-    else:
-        oled.text("--F", 98, 48, 1)
-    
-    if outdoor_humidity is not None:
-        oled.text("%d%%" % int(outdoor_humidity), 98, 56, 1)
-    else:
-        oled.text("--%", 98, 56, 1)
-    
-    oled.show()
+    show_if_changed()
+
+
+_CX = {}  # Centered x per label; titles and messages come from a small fixed set
 
 
 def _center_x(text):
-    return max(0, (128 - len(text) * 8) // 2)
+    x = _CX.get(text)
+    if x is None:
+        x = _CX[text] = max(0, (128 - len(text) * 8) // 2)
+    return x
 
 
 def format_menu_label(item):
-    label = item.get("label", "")
+    """Menu text for an item, formatted once and cached on the item dict"""
     item_type = item.get("type")
-    if item_type == "submenu":
-        return "%s >" % label
     if item_type == "toggle":
         getter = item.get("getter")
         value = False
@@ -570,16 +1020,53 @@ def format_menu_label(item):
                 value = bool(getter())
             except Exception as exc:
                 print("Toggle getter error:", exc)
-        return "%s: %s" % (label, "On" if value else "Off")
-    if item_type == "back":
-        return "< Back"
-    return label
+        key = "_text_on" if value else "_text_off"
+        cached = item.get(key)
+        if cached is None:
+            cached = item[key] = "%s: %s" % (item.get("label", ""), "On" if value else "Off")
+        return cached
+    cached = item.get("_text")
+    if cached is None:
+        label = item.get("label", "")
+        if item_type == "submenu":
+            cached = "%s >" % label
+        elif item_type == "back":
+            cached = "< Back"
+        else:
+            cached = label
+        item["_text"] = cached
+    return cached
+
+
+def _prerender(text):
+    """Rasterize fixed text once into an 8px tall page-major strip"""
+    w = len(text) * 8
+    strip = bytearray(w)
+    framebuf.FrameBuffer(strip, w, 8, framebuf.MONO_VLSB).text(text, 0, 0, 1)
+    return strip
+
+
+def _draw_label(strip, x, y):
+    """Copy a prerendered strip into the display buffer at a page-aligned y.
+    Overwrites what's there, so use it on freshly cleared rows."""
+    n = min(len(strip), 128 - x)  # Clip like text() does at the right edge
+    start = (y >> 3) * 128 + x
+    oled.buffer[start:start + n] = memoryview(strip)[:n]
+
+
+_LBL_CLICK_SELECT = _prerender("Click to select")
+_LBL_CLICK_CONTINUE = _prerender("Click to continue")
+_LBL_UP = _prerender("^")
+# Stat names sit at non page-aligned rows, so keep them as blittable buffers
+_STAT_LABEL_FBS = [
+    framebuf.FrameBuffer(_prerender(key), len(key) * 8, 8, framebuf.MONO_VLSB)
+    for key in STAT_KEYS
+]
 
 
 def render_menu_screen(menu):
     oled.fill(0)
-    title = menu.title or "Menu"
-    oled.text(title, _center_x(title), 0, 1)
+    oled.text(menu.title or "Menu", menu.title_cx, 0, 1)
     visible_items = menu.get_visible_items()
     start_index = menu.view_offset
 
@@ -592,13 +1079,13 @@ def render_menu_screen(menu):
         else:
             oled.text(label, 6, y, 1)
 
+    # Footer first: the strip copy overwrites its row, and "v" reaches into it
+    _draw_label(_LBL_CLICK_SELECT, 6, 56)
     if menu.view_offset > 0:
-        oled.text("^", 118, 8, 1)
+        _draw_label(_LBL_UP, 118, 8)
     if menu.view_offset + menu.visible_count < len(menu.items):
         oled.text("v", 118, 54, 1)
-
-    oled.text("Click to select", 6, 56, 1)
-    oled.show()
+    show_if_changed()
 
 
 def render_stats_screen():
@@ -611,10 +1098,10 @@ def render_stats_screen():
     row_spacing = 20
 
     for idx, key in enumerate(STAT_KEYS):
-        value = get_stat(key)
+        value = stats_values[idx]
         label_y = 10 + idx * row_spacing
         bar_y = label_y + 8
-        oled.text(key, bar_x, label_y, 1)
+        oled.blit(_STAT_LABEL_FBS[idx], bar_x, label_y, 0)
         oled.rect(bar_x, bar_y, bar_width, bar_height, 1)
         filled = int((value * bar_width) // 100)
         if filled > 0:
@@ -625,7 +1112,7 @@ def render_stats_screen():
         oled.text(value_str, bar_x + bar_width - 24, label_y, 1)
 
     #oled.text("Click to return", 6, 56, 1)
-    oled.show()
+    show_if_changed()
 
 
 def render_message_screen(title, subtitle=None):
@@ -633,8 +1120,8 @@ def render_message_screen(title, subtitle=None):
     oled.text(title, _center_x(title), 22, 1)
     if subtitle:
         oled.text(subtitle, _center_x(subtitle), 38, 1)
-    oled.text("Click to continue", 4, 56, 1)
-    oled.show()
+    _draw_label(_LBL_CLICK_CONTINUE, 4, 56)
+    show_if_changed()
 
 
 def render_minigame_banner(game_name, status):
@@ -645,31 +1132,25 @@ def render_minigame_banner(game_name, status):
 
 
 def handle_feed_action():
-    global current_mood, last_mood_change, frame_idx
     adjust_stat("Hunger", 25)
     adjust_stat("Health", 5)
-    current_mood = MOOD_HAPPY
-    frame_idx = 0
-    last_mood_change = time.ticks_ms()
+    set_mood(MOOD_HAPPY)
+    postpone_event(mood_event)
 
 
 def handle_play_action():
-    global current_mood, last_mood_change, frame_idx
     adjust_stat("Energy", -10)
     adjust_stat("Hunger", -5)
     adjust_stat("Health", 8)
-    current_mood = MOOD_LOVE
-    frame_idx = 0
-    last_mood_change = time.ticks_ms()
+    set_mood(MOOD_LOVE)
+    postpone_event(mood_event)
 
 
 def handle_doctor_action():
-    global current_mood, last_mood_change, frame_idx
     adjust_stat("Health", 25)
     adjust_stat("Energy", 5)
-    current_mood = MOOD_POUTING
-    frame_idx = 0
-    last_mood_change = time.ticks_ms()
+    set_mood(MOOD_POUTING)
+    postpone_event(mood_event)
 
 
 # Device/system actions
@@ -764,12 +1245,13 @@ def run_minigame(module, encoder):
 
     render_minigame_banner(game_name, "Finished")
     time.sleep_ms(300)
+    invalidate_display()
     return game_name
 
 
 # ========== MAIN LOOP ==========
-def main():
-    global frame_idx, last_mood_change, last_weather_update, manual_rain_mode, last_stat_decay
+async def main_async():
+    global manual_rain_mode, _dirty, ui_state
 
     oled.fill(0)
     oled.text("Tomogatchi", (64 - (10 * 4)), 24)
@@ -804,207 +1286,286 @@ def main():
         oled.text("WiFi Failed", 16, 24)
     oled.show()
 
-    update_sensors()
+    start_sensor_read()
     if wifi_ok:
-        update_weather()
+        # Runs alongside the UI loop below; the first fetch starts right away
+        asyncio.create_task(weather_task())
 
     encoder = RotaryEncoder(ROTARY_PIN_A, ROTARY_PIN_B, ROTARY_BUTTON_PIN)
 
-    print("Starting encoder polling thread on Core 0...")
-    _thread.start_new_thread(encoder_polling_loop, (encoder,))
+    # Poll the encoder from a hardware timer instead of a dedicated thread
+    print("Starting encoder poll timer - %dHz" % ENCODER_POLL_HZ)
+    encoder_timer = machine.Timer(0)
+    def poll_encoder(t):
+        encoder.update()
+        if _input_flag is not None and encoder.pending():
+            _input_flag.set()  # Cut the main loop's sleep short
+    encoder_timer.init(freq=ENCODER_POLL_HZ, mode=machine.Timer.PERIODIC, callback=poll_encoder)
     time.sleep_ms(30)
 
     main_menu = build_menu_structure()
+    # Navigation stacks are allocated once and refilled in place, so menu
+    # transitions don't churn the heap
+    menu_stack = []
+    menu_after_message = []
+    minigame_return_menu_stack = []
+
+    def refill(dst, src):
+        dst.clear()
+        dst.extend(src)
+
+    # Click handlers per menu item type, looked up once per click instead of
+    # walking an if/elif chain; they update the state-machine locals below
+    def open_submenu(item, current_menu):
+        submenu = item.get("submenu")
+        if submenu:
+            submenu.reset()
+            submenu.set_parent(current_menu)
+            menu_stack.append(submenu)
+
+    def go_back(item, current_menu):
+        nonlocal current_state, state_entered_at
+        if len(menu_stack) > 1:
+            menu_stack.pop()
+            menu_stack[-1].ensure_visible()
+        else:
+            menu_stack.clear()
+            current_state = STATE_IDLE
+            state_entered_at = now
+
+    def enter_state(item, current_menu):
+        nonlocal current_state, state_entered_at, menu_last_interaction
+        current_state = item.get("state") or STATE_IDLE
+        state_entered_at = now
+        if current_state == STATE_STATS:
+            menu_last_interaction = now
+
+    def flip_toggle(item, current_menu):
+        toggle_fn = item.get("toggle")
+        if toggle_fn:
+            toggle_fn()
+
+    def start_minigame(item, current_menu):
+        nonlocal pending_minigame, current_state, state_entered_at
+        module = item.get("module")
+        if module:
+            pending_minigame = module
+            refill(minigame_return_menu_stack, menu_stack)
+            current_state = STATE_MINIGAME
+            state_entered_at = now
+
+    def show_message(title, subtitle, entered_at):
+        # The one transient screen: returns to the current menu (or idle)
+        # on click or after ACTION_VIEW_DURATION_MS
+        nonlocal message_text, message_subtext, current_state, state_entered_at
+        message_text = title
+        message_subtext = subtitle
+        refill(menu_after_message, menu_stack)
+        current_state = STATE_MESSAGE
+        state_entered_at = entered_at
+
+    def run_action(item, current_menu):
+        handler = item.get("handler")
+        if handler:
+            handler()
+        show_message(item.get("message") or item.get("label", "Done"), item.get("subtitle"), now)
+
+    menu_actions = {
+        "submenu": open_submenu,
+        "back": go_back,
+        "state": enter_state,
+        "toggle": flip_toggle,
+        "minigame": start_minigame,
+    }
 
     now = time.ticks_ms()
-    last_frame_sw = now
-    last_mood_change = now
-    last_weather_update = now
-    last_render = now
-    last_sensor_update = now
-    last_stat_decay = now
+    next_render = now
+    # Start every interval from the end of boot, not from import time
+    for event in EVENTS:
+        postpone_event(event, now)
+    next_event = now
 
     current_state = STATE_IDLE
     state_entered_at = now
     menu_last_interaction = now
-    menu_stack = []
-    menu_after_message = []
     message_text = ""
     message_subtext = None
-    message_return_state = STATE_IDLE
     pending_minigame = None
-    minigame_return_menu_stack = []
-
-    try:
-        while True:
-            now = time.ticks_ms()
-            delta, clicked = encoder.read()
-
-            if delta != 0:
-                direction = "CW" if delta > 0 else "CCW"
-                print("Encoder: %s (delta=%d)" % (direction, delta))
+    last_clock_second = None
+    refresh_status_bar()
+    invalidate_display()
+
+    # Local names skip the module attribute lookup on every pass of the loop
+    ticks_ms = time.ticks_ms
+    ticks_diff = time.ticks_diff
+    ticks_add = time.ticks_add
+
+    while True:
+        now = ticks_ms()
+        delta, clicked = encoder.read()
+        prev_state = current_state
+        if delta or clicked:
+            _dirty = True
+
+        if delta != 0:
+            direction = "CW" if delta > 0 else "CCW"
+            print("Encoder: %s (delta=%d)" % (direction, delta))
+        if clicked:
+            print("Encoder: Button clicked")
+
+        if _sensor_state != SENSOR_IDLE:
+            # Only poll the sensor while a sample is in flight
+            update_sensors(now)
+
+        if _weather_mbox[0] is not None:
+            apply_weather()
+
+        # Sensor start, mood roll, stat decay and animation frame
+        if ticks_diff(now, next_event) >= 0:
+            next_event = run_due_events(EVENTS, now)
+
+        # Clock colon blinks once per second; only the idle screen shows it
+        if current_state == STATE_IDLE:
+            clock_second = time.time()
+            if clock_second != last_clock_second:
+                last_clock_second = clock_second
+                _dirty = True
+
+        if current_state == STATE_MINIGAME and pending_minigame:
+            module = pending_minigame
+            pending_minigame = None
+            game_name = run_minigame(module, encoder)
+            handle_play_action()
+            refill(menu_stack, minigame_return_menu_stack)
+            show_message(game_name, "Great game!", ticks_ms())
+            ui_state = current_state
+            menu_last_interaction = state_entered_at
+            _dirty = True
+            continue
+
+        if current_state == STATE_IDLE:
             if clicked:
-                print("Encoder: Button clicked")
-
-            if time.ticks_diff(now, last_sensor_update) >= SENSOR_UPDATE_INTERVAL_MS:
-                update_sensors()
-                last_sensor_update = now
-
-            if time.ticks_diff(now, last_mood_change) >= MOOD_CHANGE_INTERVAL:
-                change_mood()
-                last_mood_change = now
-
-            if wifi_ok and time.ticks_diff(now, last_weather_update) >= WEATHER_UPDATE_INTERVAL:
-                update_weather()
-                last_weather_update = now
-
-            if time.ticks_diff(now, last_stat_decay) >= STAT_DECAY_INTERVAL_MS:
-                decay_stats(STAT_DECAY_AMOUNT)
-                last_stat_decay = now
-
-            if time.ticks_diff(now, last_frame_sw) >= FRAME_TIME:
-                frame_idx = (frame_idx + 1) % 2
-                last_frame_sw = now
-
-            if current_state == STATE_MINIGAME and pending_minigame:
-                module = pending_minigame
-                pending_minigame = None
-                menu_preserved = list(minigame_return_menu_stack)
-                game_name = run_minigame(module, encoder)
-                handle_play_action()
-                menu_stack = list(menu_preserved)
-                menu_after_message = list(menu_stack)
-                message_text = game_name
-                message_subtext = "Great game!"
-                message_return_state = STATE_MENU if menu_stack else STATE_IDLE
-                current_state = STATE_MESSAGE
-                state_entered_at = time.ticks_ms()
-                menu_last_interaction = state_entered_at
-                continue
-
-            if current_state == STATE_IDLE:
-                if clicked:
-                    main_menu.reset()
-                    main_menu.ensure_visible()
-                    menu_stack = [main_menu]
+                main_menu.reset()
+                refill(menu_stack, (main_menu,))
+                current_state = STATE_MENU
+                state_entered_at = now
+                menu_last_interaction = now
+                clicked = False
+
+        elif current_state == STATE_MENU:
+            if not menu_stack:
+                main_menu.reset()
+                refill(menu_stack, (main_menu,))
+            current_menu = menu_stack[-1]
+            if delta:
+                current_menu.move(delta)
+                menu_last_interaction = now
+                delta = 0
+            if clicked:
+                item = current_menu.selected()
+                menu_last_interaction = now
+                clicked = False
+                if item:
+                    menu_actions.get(item.get("type"), run_action)(item, current_menu)
+            if current_state == STATE_MENU and ticks_diff(now, menu_last_interaction) >= MENU_IDLE_TIMEOUT_MS:
+                menu_stack.clear()
+                current_state = STATE_IDLE
+                state_entered_at = now
+
+        elif current_state == STATE_STATS:
+            if clicked:
+                clicked = False
+                if menu_stack:
                     current_state = STATE_MENU
-                    state_entered_at = now
-                    menu_last_interaction = now
-                    clicked = False
-
-            elif current_state == STATE_MENU:
-                if not menu_stack:
-                    main_menu.reset()
-                    main_menu.ensure_visible()
-                    menu_stack = [main_menu]
-                current_menu = menu_stack[-1]
-                if delta:
-                    current_menu.move(delta)
-                    menu_last_interaction = now
-                    delta = 0
-                if clicked:
-                    item = current_menu.selected()
                     menu_last_interaction = now
-                    clicked = False
-                    if item:
-                        item_type = item.get("type")
-                        if item_type == "submenu":
-                            submenu = item.get("submenu")
-                            if submenu:
-                                submenu.reset()
-                                submenu.set_parent(current_menu)
-                                menu_stack.append(submenu)
-                        elif item_type == "back":
-                            if len(menu_stack) > 1:
-                                menu_stack.pop()
-                                menu_stack[-1].ensure_visible()
-                            else:
-                                menu_stack = []
-                                current_state = STATE_IDLE
-                                state_entered_at = now
-                        elif item_type == "state":
-                            target_state = item.get("state")
-                            current_state = target_state or STATE_IDLE
-                            state_entered_at = now
-                            if current_state == STATE_STATS:
-                                menu_last_interaction = now
-                        elif item_type == "toggle":
-                            toggle_fn = item.get("toggle")
-                            if toggle_fn:
-                                toggle_fn()
-                        elif item_type == "minigame":
-                            module = item.get("module")
-                            if module:
-                                pending_minigame = module
-                                minigame_return_menu_stack = list(menu_stack)
-                                current_state = STATE_MINIGAME
-                                state_entered_at = now
-                        else:
-                            handler = item.get("handler")
-                            if handler:
-                                handler()
-                            message_text = item.get("message") or item.get("label", "Done")
-                            message_subtext = item.get("subtitle")
-                            menu_after_message = list(menu_stack)
-                            message_return_state = STATE_MENU if menu_after_message else STATE_IDLE
-                            current_state = STATE_MESSAGE
-                            state_entered_at = now
-                if current_state == STATE_MENU and time.ticks_diff(now, menu_last_interaction) >= MENU_IDLE_TIMEOUT_MS:
-                    menu_stack = []
+                else:
                     current_state = STATE_IDLE
-                    state_entered_at = now
-
-            elif current_state == STATE_STATS:
-                if clicked:
-                    clicked = False
-                    if menu_stack:
-                        current_state = STATE_MENU
-                        menu_last_interaction = now
-                    else:
-                        current_state = STATE_IDLE
-                    state_entered_at = now
-                elif delta:
+                state_entered_at = now
+            elif delta:
+                menu_last_interaction = now
+            if ticks_diff(now, menu_last_interaction) >= MENU_IDLE_TIMEOUT_MS:
+                current_state = STATE_IDLE
+                menu_stack.clear()
+                state_entered_at = now
+
+        elif current_state == STATE_MESSAGE:
+            if clicked or ticks_diff(now, state_entered_at) >= ACTION_VIEW_DURATION_MS:
+                clicked = False
+                if menu_after_message:
+                    refill(menu_stack, menu_after_message)
+                    current_state = STATE_MENU
                     menu_last_interaction = now
-                if time.ticks_diff(now, menu_last_interaction) >= MENU_IDLE_TIMEOUT_MS:
+                else:
+                    menu_stack.clear()
                     current_state = STATE_IDLE
-                    menu_stack = []
-                    state_entered_at = now
+                state_entered_at = now
+                menu_after_message.clear()
 
+        if current_state != prev_state:
+            _dirty = True
+            ui_state = current_state
+            if current_state == STATE_IDLE:
+                # Collect now, between screens, rather than mid-render later
+                gc.collect()
+        # Rain drops re-randomize every frame, so keep animating while it's shown
+        if current_state == STATE_IDLE and (manual_rain_mode or weather_condition in RAIN_CONDITIONS):
+            _dirty = True
+
+        if _dirty and ticks_diff(now, next_render) >= 0:
+            _dirty = False
+            if current_state == STATE_IDLE:
+                render()
+            elif current_state == STATE_MENU:
+                render_menu_screen(menu_stack[-1] if menu_stack else main_menu)
+            elif current_state == STATE_STATS:
+                render_stats_screen()
             elif current_state == STATE_MESSAGE:
-                expired = time.ticks_diff(now, state_entered_at) >= ACTION_VIEW_DURATION_MS
-                if clicked or expired:
-                    if clicked:
-                        clicked = False
-                    if message_return_state == STATE_MENU and menu_after_message:
-                        menu_stack = list(menu_after_message)
-                        current_state = STATE_MENU
-                        menu_last_interaction = now
-                    else:
-                        menu_stack = []
-                        current_state = STATE_IDLE
-                    state_entered_at = now
-                    message_text = ""
-                    message_subtext = None
-                    menu_after_message = []
-
-            if time.ticks_diff(now, last_render) >= RENDER_INTERVAL_MS:
-                if current_state == STATE_IDLE:
-                    render()
-                elif current_state == STATE_MENU:
-                    current_menu = menu_stack[-1] if menu_stack else main_menu
-                    current_menu.ensure_visible()
-                    render_menu_screen(current_menu)
-                elif current_state == STATE_STATS:
-                    render_stats_screen()
-                elif current_state == STATE_MESSAGE:
-                    render_message_screen(message_text or "Done", message_subtext)
-                last_render = now
+                render_message_screen(message_text or "Done", message_subtext)
+            # Re-arm from now, not the old deadline, so an idle gap can't
+            # bank up a burst of back-to-back renders
+            next_render = ticks_add(now, RENDER_INTERVAL_MS)
+
+        # Sleep until the next deadline instead of spinning; the weather task
+        # runs meanwhile and encoder input wakes us early
+        now = ticks_ms()
+        wait = ticks_diff(next_event, now)
+        if _dirty:
+            wait = min(wait, ticks_diff(next_render, now))
+        if _sensor_state != SENSOR_IDLE:
+            wait = min(wait, sensor.ms_until_ready(now))
+        await wait_for_input(max(0, min(wait, MAX_SLEEP_MS)))
 
+
+try:
+    _input_flag = asyncio.ThreadSafeFlag()
+except AttributeError:
+    _input_flag = None  # Older uasyncio; fall back to fixed-interval polling
+
+
+async def wait_for_input(timeout_ms):
+    """Sleep up to timeout_ms, returning early if the encoder has input"""
+    if _input_flag is None:
+        await asyncio.sleep_ms(min(timeout_ms, LOOP_SLEEP_MS))
+        return
+    if timeout_ms <= 0:
+        await asyncio.sleep_ms(0)
+        return
+    try:
+        await asyncio.wait_for_ms(_input_flag.wait(), timeout_ms)
+    except asyncio.TimeoutError:
+        pass
+
+
+def main():
+    try:
+        asyncio.run(main_async())
     except KeyboardInterrupt:
         oled.fill(1)
         oled.text("Stopped.", 32, 28, 0)
         oled.show()
         print("Pet stopped by user.")
+    finally:
+        asyncio.new_event_loop()  # Clear leftover tasks if main() is re-run from the REPL
 
 
 if __name__ == "__main__":
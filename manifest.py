@@ -0,0 +1,21 @@
+# Frozen-module manifest for a custom ESP32 firmware build.
+# Frozen modules run from flash: the ASCII sprite art stays out of the heap and
+# nothing is compiled at boot. main.py and config.py stay on the filesystem
+# so the board still auto-runs main.py and settings can be edited.
+#
+#   cd micropython/ports/esp32
+#   make BOARD=ESP32_GENERIC FROZEN_MANIFEST=/path/to/this/manifest.py
+include("$(PORT_DIR)/boards/manifest.py")
+
+for name in (
+    "sprites.py",
+    "digits.py",
+    "ssd1306.py",
+    "menu.py",
+    "rotary_encoder.py",
+    "rotary_encoder_irq.py",
+    "minigame_a.py",
+    "minigame_b.py",
+    "minigame_c.py",
+):
+    module(name, opt=3)
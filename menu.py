@@ -2,8 +2,12 @@
 
 
 class Menu:
-    def __init__(self, title, items, parent=None, visible_count=3):
+    # The scroll window only changes in move(), set_items(), set_visible_count()
+    # and reset(), so those keep it valid and renderers never re-check it
+    def __init__(self, title, items, parent=None, visible_count=3, screen_width=128):
         self.title = title
+        # Centered x of the 8px-font title, fixed for the menu's lifetime
+        self.title_cx = max(0, (screen_width - len(title or "Menu") * 8) // 2)
         self.parent = parent
         self._items = list(items)
         self._index = 0
@@ -27,7 +31,10 @@ class Menu:
         return self._visible_count
 
     def set_items(self, items):
-        self._items = list(items)
+        items = list(items)
+        if items == self._items:
+            return
+        self._items = items
         self.reset()
 
     def set_parent(self, parent):
@@ -12,6 +12,33 @@ def _center_text(text, screen_width=128, char_width=8):
     return max(0, (screen_width - len(text) * char_width) // 2)
 
 
+def _layout(text, y):
+    """(text, x, y) for a centered fixed label, drawn with oled.text(*msg, 1)"""
+    return (text, _center_text(text), y)
+
+
+# Fixed labels are laid out once at import, not on every screen
+_MSG_GET_READY = _layout("Get Ready...", 35)
+_MSG_REACTION = _layout("Reaction Time:", 20)
+_MSG_TOO_SLOW = _layout("Too Slow!", 28)
+_MSG_AVERAGE = _layout("Average Time:", 15)
+_MSG_NO_TIMES = _layout("No valid times", 28)
+# "Round %d/%d" is always 9 characters for single-digit rounds
+_X_ROUND = _center_text("Round 0/0")
+# (average below this many ms, rating) checked in order; None catches the rest
+_RATINGS = tuple(
+    (limit, _layout(text, 45))
+    for limit, text in (
+        (200, "DAMN GIRL!"),
+        (300, "WOAH!"),
+        (400, "Good!"),
+        (None, "Keep trying..."),
+    )
+)
+
+FLASH_MS = 15  # About one full-frame transfer, as long as the old fill(1)/show() flash
+
+
 def main_loop(oled, encoder):
     """Run the reaction time mini game.
     
@@ -28,12 +55,17 @@ def main_loop(oled, encoder):
     rounds = 5
     reaction_times = []
     
+    # Local names skip the attribute lookups between the flash and the click
+    ticks_ms = time.ticks_ms
+    ticks_diff = time.ticks_diff
+    sleep_ms = time.sleep_ms
+    
     for round_num in range(1, rounds + 1):
         # Show "Ready..." message
         oled.fill(0)
         ready_text = "Round %d/%d" % (round_num, rounds)
-        oled.text(ready_text, _center_text(ready_text), 20, 1)
-        oled.text("Get Ready...", _center_text("Get Ready..."), 35, 1)
+        oled.text(ready_text, _X_ROUND, 20, 1)
+        oled.text(*_MSG_GET_READY, 1)
         oled.show()
         
         # Wait random time (1-3 seconds) to prevent anticipation
@@ -44,49 +76,38 @@ def main_loop(oled, encoder):
         if encoder is not None:
             encoder.reset()
         
-        # FLASH! - Fill screen white for one frame
-        
-        oled.fill(1)
-        oled.show()
+        # FLASH! - Blank the screen, then use the panel's invert command to
+        # turn it white: two one-byte commands instead of two full frames
         oled.fill(0)
         oled.show()
+        # Timing starts as the screen lights up, so a press during the flash counts
+        start_time = ticks_ms()
+        oled.invert(True)
+        sleep_ms(FLASH_MS)
+        oled.invert(False)
         
-        # Start timing immediately after flash
-        start_time = time.ticks_ms()
-        
-        # Wait for button press
-        button_pressed = False
+        # Wait for button press; the encoder timestamps the press in its
+        # IRQ, so the result doesn't depend on how often we poll
         timeout_ms = 5000  # 5 second timeout
-        
-        while not button_pressed:
-            now = time.ticks_ms()
-            
-            # Check for timeout
-            if time.ticks_diff(now, start_time) > timeout_ms:
-                reaction_time = -1  # Indicate timeout
-                break
-            
-            # Check for button press
-            if encoder is not None:
-                delta, clicked = encoder.read()
-                if clicked:
-                    reaction_time = time.ticks_diff(now, start_time)
-                    button_pressed = True
-            
-            time.sleep_ms(5)  
+        pressed_at = encoder.wait_click(timeout_ms) if encoder is not None else None
+        if pressed_at is None:
+            reaction_time = None  # Timed out
+        else:
+            # Clamp a press that landed just before the clock started
+            reaction_time = max(0, ticks_diff(pressed_at, start_time))
         
         # Store result
-        if reaction_time > 0:
+        if reaction_time is not None:
             reaction_times.append(reaction_time)
         
         # Display result for this round
         oled.fill(0)
-        if reaction_time > 0:
+        if reaction_time is not None:
             result_text = "%d ms" % reaction_time
-            oled.text("Reaction Time:", _center_text("Reaction Time:"), 20, 1)
+            oled.text(*_MSG_REACTION, 1)
             oled.text(result_text, _center_text(result_text), 35, 1)
         else:
-            oled.text("Too Slow!", _center_text("Too Slow!"), 28, 1)
+            oled.text(*_MSG_TOO_SLOW, 1)
         oled.show()
         
         # Pause to show result
@@ -100,22 +121,17 @@ def main_loop(oled, encoder):
     oled.fill(0)
     if reaction_times:
         avg_time = sum(reaction_times) // len(reaction_times)
-        oled.text("Average Time:", _center_text("Average Time:"), 15, 1)
+        oled.text(*_MSG_AVERAGE, 1)
         avg_text = "%d ms" % avg_time
         oled.text(avg_text, _center_text(avg_text), 30, 1)
         
         # Show performance rating
-        if avg_time < 200:
-            rating = "DAMN GIRL!"
-        elif avg_time < 300:
-            rating = "WOAH!"
-        elif avg_time < 400:
-            rating = "Good!"
-        else:
-            rating = "Keep trying..."
-        oled.text(rating, _center_text(rating), 45, 1)
+        for limit, rating in _RATINGS:
+            if limit is None or avg_time < limit:
+                oled.text(*rating, 1)
+                break
     else:
-        oled.text("No valid times", _center_text("No valid times"), 28, 1)
+        oled.text(*_MSG_NO_TIMES, 1)
     
     oled.show()
     time.sleep_ms(2500)
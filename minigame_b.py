@@ -1,6 +1,7 @@
 """Perfect Timing Mini Game - Stop at exactly 10 seconds!"""
 
 import time
+from digits import DOT, draw_glyph, draw_number
 
 
 GAME_NAME = "Perfect 10"
@@ -11,6 +12,22 @@ def _center_text(text, screen_width=128, char_width=8):
     return max(0, (screen_width - len(text) * char_width) // 2)
 
 
+# Fixed labels are centered once at import, not on every frame
+_X_STOP_AT = _center_text("Stop at")
+_X_TARGET = _center_text("10.000")
+_X_SECONDS_BANG = _center_text("seconds!")
+_X_SECONDS = _center_text("seconds")
+_X_CLICK_STOP = _center_text("Click to stop!")
+_X_YOUR_TIME = _center_text("Your time:")
+# The running timer is laid out as "%2d.%03d" so it stays put as digits change
+_X_TIMER = _center_text("00.000")
+_X_TIMER_DOT = _X_TIMER + 2 * 8
+_X_TIMER_MS = _X_TIMER + 3 * 8
+_TIMER_Y = 20
+_TIMER_PAGES = (2, 3)  # OLED pages (8 rows each) covering rows 16-31
+_TIMER_W = 6 * 8  # "00.000"
+
+
 def main_loop(oled, encoder):
     """Run the perfect timing mini game.
     
@@ -27,9 +44,9 @@ def main_loop(oled, encoder):
     
     # Show instructions
     oled.fill(0)
-    oled.text("Stop at", _center_text("Stop at"), 10, 1)
-    oled.text("10.000", _center_text("10.000"), 25, 1)
-    oled.text("seconds!", _center_text("seconds!"), 40, 1)
+    oled.text("Stop at", _X_STOP_AT, 10, 1)
+    oled.text("10.000", _X_TARGET, 25, 1)
+    oled.text("seconds!", _X_SECONDS_BANG, 40, 1)
     oled.show()
     time.sleep_ms(1000)
     
@@ -45,15 +62,31 @@ def main_loop(oled, encoder):
     if encoder is not None:
         encoder.reset()
     
+    # Static labels are drawn once; each frame only redraws the timer pages
+    oled.fill(0)
+    oled.text("seconds", _X_SECONDS, 35, 1)
+    oled.text("Click to stop!", _X_CLICK_STOP, 50, 1)
+    oled.show()
+    
     # Start timer
     start_time = time.ticks_ms()
     button_pressed = False
     stopped_time_ms = 0
+    shown_ms = -1  # Last value pushed to the panel
+    
+    # Local names skip the attribute lookups on every pass of the loop
+    ticks_ms = time.ticks_ms
+    ticks_diff = time.ticks_diff
+    sleep_ms = time.sleep_ms
+    fill_rect = oled.fill_rect
+    fbuf = oled.framebuf
+    show_window = oled.show_window
+    is_pressed = encoder.is_pressed if encoder is not None else None
     
     # Main timing loop
     while not button_pressed:
-        now = time.ticks_ms()
-        elapsed_ms = time.ticks_diff(now, start_time)
+        now = ticks_ms()
+        elapsed_ms = ticks_diff(now, start_time)
         
         # Auto-stop if they go way over (15 seconds)
         if elapsed_ms > 15000:
@@ -63,31 +96,26 @@ def main_loop(oled, encoder):
         
         # Check for button press (detect press down, not release)
         if encoder is not None:
-            # Check if button is currently pressed (active low - 0 = pressed)
-            if encoder.button.value() == 0:
+            # Debounced state from the encoder's button IRQ
+            if is_pressed():
                 stopped_time_ms = elapsed_ms
                 button_pressed = True
         
-        # Display current time
-        oled.fill(0)
-        
-        # Convert to seconds with 3 decimal places
-        seconds = elapsed_ms / 1000.0
-        
-        # Format as X.XXX (with 3 decimal places)
-        # MicroPython doesn't have great float formatting, so we'll do it manually
-        whole_seconds = int(seconds)
-        fractional = int((seconds - whole_seconds) * 1000)
-        
-        time_text = "%d.%03d" % (whole_seconds, fractional)
-        
-        # Display the timer large in center
-        oled.text(time_text, _center_text(time_text), 20, 1)
-        oled.text("seconds", _center_text("seconds"), 35, 1)
-        oled.text("Click to stop!", _center_text("Click to stop!"), 50, 1)
-        oled.show()
+        # Display current time, skipping the I2C write when it hasn't moved
+        if elapsed_ms != shown_ms:
+            shown_ms = elapsed_ms
+            fill_rect(_X_TIMER, _TIMER_PAGES[0] * 8, _TIMER_W, 16, 0)
+            
+            # Draw X.XXX from pre-rendered digit glyphs in integer math; floats
+            # are slow on the ESP32 and can round the milliseconds off by one
+            draw_number(fbuf, elapsed_ms // 1000, _X_TIMER, _TIMER_Y, 2)
+            draw_glyph(fbuf, DOT, _X_TIMER_DOT, _TIMER_Y)
+            draw_number(fbuf, elapsed_ms % 1000, _X_TIMER_MS, _TIMER_Y, 3, True)
+            
+            # Push only the timer's columns of its two pages
+            show_window(_X_TIMER, _X_TIMER + _TIMER_W - 1, _TIMER_PAGES[0], _TIMER_PAGES[1])
         
-        time.sleep_ms(10)  # Small delay for responsiveness
+        sleep_ms(10)  # Small delay for responsiveness
     
     # Calculate score
     target_ms = 10000  # 10.000 seconds
@@ -114,19 +142,17 @@ def main_loop(oled, encoder):
         accuracy = "0.%03ds off" % difference_ms
     else:
         score_text = "Try again"
-        seconds_off = difference_ms / 1000.0
-        accuracy = "%.2fs off" % seconds_off
+        # Hundredths, rounded like the old "%.2f"
+        hundredths = (difference_ms + 5) // 10
+        accuracy = "%d.%02ds off" % (hundredths // 100, hundredths % 100)
     
     # Display result
     oled.fill(0)
     
     # Show their time
-    final_seconds = stopped_time_ms / 1000.0
-    whole = int(final_seconds)
-    frac = int((final_seconds - whole) * 1000)
-    your_time = "%d.%03d" % (whole, frac)
+    your_time = "%d.%03d" % (stopped_time_ms // 1000, stopped_time_ms % 1000)
     
-    oled.text("Your time:", _center_text("Your time:"), 5, 1)
+    oled.text("Your time:", _X_YOUR_TIME, 5, 1)
     oled.text(your_time, _center_text(your_time), 18, 1)
     oled.text(score_text, _center_text(score_text), 35, 1)
     oled.text(accuracy, _center_text(accuracy), 48, 1)
@@ -1,6 +1,9 @@
 """Spin Speed Mini Game - Spin the wheel as fast as you can!"""
 
 import time
+import micropython
+from array import array
+from digits import draw_big_number, draw_number
 
 GAME_NAME = "Spin"
 
@@ -10,6 +13,27 @@ def _center_text(text, screen_width=128, char_width=8):
     return max(0, (screen_width - len(text) * char_width) // 2)
 
 
+# Fixed labels are centered once at import, not on every frame
+_X_SPIN_WHEEL = _center_text("Spin the wheel!")
+_X_FAST = _center_text("Fast as you can")
+_X_CLICK_FINISH = _center_text("Click to finish")
+_X_SPIN = _center_text("SPIN!")
+_X_RESULT = _center_text("RESULT")
+_X_RIGHT4 = 128 - 4 * 8 - 2  # Right-aligned 4-digit readouts
+_X_RIGHT4_BIG = 128 - 4 * 16 - 2  # Same for the 16px current-RPM digits
+_RPM_Y = 26  # Big digits span rows 26-41; the "RPM:" label is centered on them
+# The HUD (Time/RPM/Max) sits in pages 1-6; the "SPIN!" title in page 0
+# is drawn once and the empty bottom page is never re-sent
+_HUD_PAGES = (1, 6)
+
+# Step timestamps within the RPM window live in a fixed ring buffer, so
+# recording and pruning steps never allocates or shifts a list
+_RING_SIZE = 1024  # Power of two; far more steps than a 1s window can see
+_RING_MASK = _RING_SIZE - 1
+_ring = array('i', bytes(4 * _RING_SIZE))
+
+
+@micropython.native
 def main_loop(oled, encoder):
     """Spin as fast as possible. Measures peak RPM over a rolling 1s window."""
     # Configuration
@@ -37,75 +61,102 @@ def main_loop(oled, encoder):
 
     # Intro screen
     oled.fill(0)
-    oled.text("Spin the wheel!", _center_text("Spin the wheel!"), 8, 1)
-    oled.text("Fast as you can", _center_text("Fast as you can"), 22, 1)
-    oled.text("Click to finish", _center_text("Click to finish"), 42, 1)
+    oled.text("Spin the wheel!", _X_SPIN_WHEEL, 8, 1)
+    oled.text("Fast as you can", _X_FAST, 22, 1)
+    oled.text("Click to finish", _X_CLICK_FINISH, 42, 1)
     oled.show()
     time.sleep_ms(900)
 
     # Game state
     start_ms = time.ticks_ms()
     last_ui_ms = start_ms
-    timestamps = []  # step timestamps within WINDOW_MS
+    head = 0  # Oldest step timestamp within WINDOW_MS
+    tail = 0  # Next free slot in _ring
     total_steps = 0
     max_rpm = 0
+    # Last values drawn; the screen is only redrawn when one of these changes
+    shown_remaining = shown_rpm = shown_max = -1
+    time_text = ""
+    oled.fill(0)
+    oled.text("SPIN!", _X_SPIN, 0, 1)
+    oled.show()
+
+    # Local names skip the attribute/global lookups on every pass of the loop
+    ticks_ms = time.ticks_ms
+    ticks_diff = time.ticks_diff
+    sleep_ms = time.sleep_ms
+    fill_rect = oled.fill_rect
+    text = oled.text
+    show_pages = oled.show_pages
+    fbuf = oled.framebuf
+    read = encoder.read if encoder is not None else None
+    ring = _ring
 
     # Main loop
     while True:
-        now = time.ticks_ms()
-        elapsed = time.ticks_diff(now, start_ms)
+        now = ticks_ms()
+        elapsed = ticks_diff(now, start_ms)
         if elapsed >= GAME_DURATION_MS:
             break
 
         # Read encoder
         clicked = False
         if encoder is not None:
-            delta, clicked = encoder.read()
+            delta, clicked = read()
             if delta:
                 steps = abs(int(delta))
                 total_steps += steps
                 for _ in range(steps):
-                    timestamps.append(now)
+                    ring[tail] = now
+                    tail = (tail + 1) & _RING_MASK
+                    if tail == head:  # Full: drop the oldest step
+                        head = (head + 1) & _RING_MASK
 
         # End early if clicked
         if clicked:
             break
 
         # Drop old timestamps outside the window
-        cutoff = now - WINDOW_MS
-        # Efficient in-place prune for small lists
-        while timestamps and timestamps[0] < cutoff:
-            timestamps.pop(0)
+        while head != tail and ticks_diff(now, ring[head]) > WINDOW_MS:
+            head = (head + 1) & _RING_MASK
 
         # Compute RPM from steps in the last window
-        steps_in_window = len(timestamps)
+        steps_in_window = (tail - head) & _RING_MASK
         # rpm = steps_per_sec / steps_per_rev * 60
         rpm = (steps_in_window * 60000) // (STEPS_PER_REV * WINDOW_MS) if STEPS_PER_REV > 0 else 0
         if rpm > max_rpm:
             max_rpm = rpm
 
         # UI update at cadence
-        if time.ticks_diff(now, last_ui_ms) >= FRAME_DELAY_MS:
+        if ticks_diff(now, last_ui_ms) >= FRAME_DELAY_MS:
             remaining = max(0, (GAME_DURATION_MS - elapsed) // 1000)
-            oled.fill(0)
-            oled.text("SPIN!", _center_text("SPIN!"), 0, 1)
-            oled.text("Time: %ds" % remaining, 2, 14, 1)
-            oled.text("RPM:", 2, 30, 1)
-            # Right-align current rpm
-            rpm_text = "%4d" % rpm
-            oled.text(rpm_text, 128 - (len(rpm_text) * 8) - 2, 30, 1)
-            oled.text("Max:", 2, 44, 1)
-            max_text = "%4d" % max_rpm
-            oled.text(max_text, 128 - (len(max_text) * 8) - 2, 44, 1)
-            oled.show()
+            changed = False
+            if remaining != shown_remaining:
+                shown_remaining = remaining
+                time_text = "Time: %ds" % remaining
+                changed = True
+            if rpm != shown_rpm:
+                shown_rpm = rpm
+                changed = True
+            if max_rpm != shown_max:
+                shown_max = max_rpm
+                changed = True
+            if changed:
+                fill_rect(0, _HUD_PAGES[0] * 8, 128, (_HUD_PAGES[1] - _HUD_PAGES[0] + 1) * 8, 0)
+                text(time_text, 2, 14, 1)
+                text("RPM:", 2, _RPM_Y + 4, 1)
+                draw_big_number(fbuf, rpm, _X_RIGHT4_BIG, _RPM_Y, 4)
+                text("Max:", 2, 46, 1)
+                draw_number(fbuf, max_rpm, _X_RIGHT4, 46, 4)
+                show_pages(_HUD_PAGES[0], _HUD_PAGES[1])
             last_ui_ms = now
 
-        time.sleep_ms(FRAME_DELAY_MS)
+        sleep_ms(FRAME_DELAY_MS)
 
     # Final results
     total_revs_int = total_steps // STEPS_PER_REV if STEPS_PER_REV > 0 else 0
     oled.fill(0)
-    oled.text("RESULT", _center_text("RESULT"), 4, 1)
+    oled.text("RESULT", _X_RESULT, 4, 1)
     oled.text("Max RPM:", 8, 22, 1)
     oled.text("%d" % max_rpm, _center_text("%d" % max_rpm), 36, 1)
     oled.text("%d revs" % total_revs_int, _center_text("%d revs" % total_revs_int), 50, 1)
@@ -2,7 +2,44 @@
 
 from machine import Pin
 import time
-import _thread
+import micropython
+from micropython import const
+
+# Module-level aliases save the time.* attribute lookup in the poll and IRQ paths
+_ticks_ms = time.ticks_ms
+_ticks_diff = time.ticks_diff
+
+
+# Gray code state transitions, indexed by t = last_state << 2 | current_state:
+#   from 00: 00->00(0), 00->01(1-CW), 00->10(-1-CCW), 00->11(0-invalid)
+#   from 01: 01->00(-1-CCW), 01->01(0), 01->10(0-invalid), 01->11(1-CW)
+#   from 10: 10->00(1-CW), 10->01(0-invalid), 10->10(0), 10->11(-1-CCW)
+#   from 11: 11->00(0-invalid), 11->01(-1-CCW), 11->10(1-CW), 11->11(0)
+# Packed as one bit per t, so direction = (CW >> t & 1) - (CCW >> t & 1)
+# NOTE: Direction swapped - was backwards for this encoder
+_CW_MASK = const(0x4182)   # t = 1, 7, 8, 14
+_CCW_MASK = const(0x2814)  # t = 2, 4, 11, 13
+
+
+@micropython.viper
+def _decode(state: ptr8, encoded: int) -> int:
+    # Apply one pin-state change to state = [last_encoded, transition_count + 4].
+    # Returns 0 for an invalid transition, 1 for a counted one, and +/-2 when
+    # 4 transitions in the same direction complete a step.
+    t = (state[0] << 2) | encoded
+    direction = ((_CW_MASK >> t) & 1) - ((_CCW_MASK >> t) & 1)
+    state[0] = encoded  # Update state after debounce
+    if direction == 0:
+        return 0
+    count = state[1] + direction
+    if count >= 8:
+        state[1] = 4
+        return 2
+    if count <= 0:
+        state[1] = 4
+        return -2
+    state[1] = count
+    return 1
 
 
 class RotaryEncoder:
@@ -25,8 +62,11 @@ class RotaryEncoder:
         self._button_debounce_ms = button_debounce_ms
         self._delta_cap = delta_cap
 
-        # Track full encoder state (both A and B pins)
-        self._last_encoded = (self.pin_a.value() << 1) | self.pin_b.value()
+        # Track full encoder state (both A and B pins) plus the transition
+        # count (offset by 4 so it fits a byte) for the 4:1 ratio
+        self._state = bytearray(2)
+        self._state[0] = (self.pin_a.value() << 1) | self.pin_b.value()
+        self._state[1] = 4
         self._last_button = self.button.value()
 
         now = time.ticks_ms()
@@ -34,91 +74,110 @@ class RotaryEncoder:
         self._last_button_time = now
         self._button_press_time = None
 
-        # Gray code state transition lookup table
-        # Format: [last_state << 2 | current_state] = direction
-        # Valid transitions: 0=no change, 1=CW, -1=CCW
-        # NOTE: Direction swapped - was backwards for this encoder
-        self._transition_table = [
-            0,  1, -1,  0,   # from 00: 00->00(0), 00->01(1-CW), 00->10(-1-CCW), 00->11(0-invalid)
-           -1,  0,  0,  1,   # from 01: 01->00(-1-CCW), 01->01(0), 01->10(0-invalid), 01->11(1-CW)
-            1,  0,  0, -1,   # from 10: 10->00(1-CW), 10->01(0-invalid), 10->10(0), 10->11(-1-CCW)
-            0, -1,  1,  0    # from 11: 11->00(0-invalid), 11->01(-1-CCW), 11->10(1-CW), 11->11(0)
-        ]
-
-        # Thread-safe shared state
-        self._lock = _thread.allocate_lock()
-        self._rotation_delta = 0
-        self._transition_count = 0  # Count transitions for 4:1 ratio
-        self._button_clicked = False
-
-    def update(self):
-        """Poll the encoder and button, updating internal event counters."""
-        self._read_rotation()
-        self._read_button()
-
-    def _read_rotation(self):
+        # Shared state without a lock: each counter has a single writer. The
+        # poller/IRQ only ever bump _steps/_clicks and read() only moves its
+        # own _steps_read/_clicks_read marks, so no interleaving loses events
+        self._steps = 0
+        self._steps_read = 0
+        self._clicks = 0
+        self._clicks_read = 0
+        self._click_time = 0  # ticks_ms() at the press of the last click
+
+        # Button is edge-triggered; update() only re-reads it to recover from
+        # edges the debounce dropped
+        self.button.irq(trigger=Pin.IRQ_FALLING | Pin.IRQ_RISING, handler=self._button_irq)
+
+    def update(self, now=None):
+        """Poll the encoder, updating internal event counters.
+
+        Callers that already have ticks_ms() for this pass can pass it as now;
+        otherwise the clock is only read when the pins have changed.
+        """
+        self._read_rotation(now)
+
+        # The IRQ drops edges inside the debounce window, so a short tap or a
+        # release that bounces into it leaves no edge to commit the final
+        # level. Once the window has passed, settle on what the pin reads.
+        current_button = self.button.value()
+        if current_button != self._last_button:
+            if now is None:
+                now = _ticks_ms()
+            if _ticks_diff(now, self._last_button_time) >= self._button_debounce_ms:
+                self._set_button(current_button, now)
+
+    def _read_rotation(self, now=None):
         # Read both encoder pins and encode as 2-bit value
         current_a = self.pin_a.value()
         current_b = self.pin_b.value()
         current_encoded = (current_a << 1) | current_b
         
         # Check if state changed
-        if current_encoded != self._last_encoded:
-            now = time.ticks_ms()
-            if time.ticks_diff(now, self._last_step_time) >= self._step_debounce_ms:
-                # Use Gray code state transition table for robust direction detection
-                transition = (self._last_encoded << 2) | current_encoded
-                direction = self._transition_table[transition]
-                
-                # Only acquire lock if we have a valid rotation to record
-                if direction != 0:  # Valid transition
-                    # Accumulate 4 transitions before reporting 1 step
-                    self._transition_count += direction
-                    
-                    # Every 4 transitions in same direction = 1 step
-                    if self._transition_count >= 4:
-                        self._lock.acquire()
-                        self._rotation_delta += 1
-                        self._lock.release()
-                        self._transition_count = 0
-                    elif self._transition_count <= -4:
-                        self._lock.acquire()
-                        self._rotation_delta -= 1
-                        self._lock.release()
-                        self._transition_count = 0
-                    
+        if current_encoded != self._state[0]:
+            if now is None:
+                now = _ticks_ms()
+            if _ticks_diff(now, self._last_step_time) >= self._step_debounce_ms:
+                # Gray code table lookup and 4:1 step counting run natively
+                result = _decode(self._state, current_encoded)
+                if result:  # Valid transition
                     self._last_step_time = now
-                
-                self._last_encoded = current_encoded  # Update state after debounce
-
-    def _read_button(self):
-        current_button = self.button.value()
-        if current_button != self._last_button:
-            now = time.ticks_ms()
-            if time.ticks_diff(now, self._last_button_time) >= self._button_debounce_ms:
-                self._last_button_time = now
-                self._last_button = current_button  # Update after debounce
-                if current_button == 0:  # Button pressed (active low)
-                    self._button_press_time = now
-                    print("Encoder button: pressed")
-                else:  # Button released
-                    if self._button_press_time is not None:
-                        self._lock.acquire()
-                        self._button_clicked = True
-                        self._lock.release()
-                        print("Encoder button: released -> click registered")
-                    self._button_press_time = None
+                    if result != 1:
+                        self._steps += 1 if result > 0 else -1
+
+    def _button_irq(self, pin):
+        """IRQ handler for button press/release with software debounce."""
+        current_button = pin.value()
+        now = _ticks_ms()
+        if current_button == self._last_button:
+            return
+        if _ticks_diff(now, self._last_button_time) < self._button_debounce_ms:
+            return  # update() re-reads the pin once the window has passed
+        self._set_button(current_button, now)
+
+    def _set_button(self, current_button, now):
+        # Only called from the IRQ and the Timer-driven update(), which are
+        # both scheduled callbacks and so never interleave
+        self._last_button_time = now
+        self._last_button = current_button
+        if current_button == 0:  # Button pressed (active low)
+            self._button_press_time = now
+        else:  # Button released
+            if self._button_press_time is not None:
+                self._click_time = self._button_press_time
+                self._clicks += 1
+            self._button_press_time = None
+
+    def is_pressed(self):
+        """True while the button is held down (debounced)."""
+        return self._last_button == 0
+
+    def pending(self):
+        """True if a step or click is waiting for read(); safe from a Timer callback."""
+        return self._steps != self._steps_read or self._clicks != self._clicks_read
+
+    def wait_click(self, timeout_ms):
+        """Wait up to timeout_ms for a click and consume it.
+
+        Returns the ticks_ms() value captured in the IRQ when the button went
+        down, or None on timeout. Rotation is left pending for read().
+        """
+        deadline = time.ticks_add(time.ticks_ms(), timeout_ms)
+        while self._clicks == self._clicks_read:
+            if time.ticks_diff(deadline, time.ticks_ms()) <= 0:
+                return None
+            time.sleep_ms(1)
+        self._clicks_read = self._clicks
+        return self._click_time
 
     def read(self):
         """Return accumulated (delta_steps, button_clicked) since last read.
         Delta is capped to ±1 to prevent rapid scrolling.
         """
-        self._lock.acquire()
-        delta = self._rotation_delta
-        clicked = self._button_clicked
-        self._rotation_delta = 0
-        self._button_clicked = False
-        self._lock.release()
+        steps = self._steps
+        clicks = self._clicks
+        delta = steps - self._steps_read
+        clicked = clicks != self._clicks_read
+        self._steps_read = steps
+        self._clicks_read = clicks
         
         # Cap delta to prevent rapid scrolling
         if delta > self._delta_cap:
@@ -130,12 +189,10 @@ class RotaryEncoder:
 
     def reset(self):
         """Clear any pending events and reset debounce tracking."""
-        self._lock.acquire()
-        self._rotation_delta = 0
-        self._button_clicked = False
-        self._lock.release()
-        self._transition_count = 0
-        self._last_encoded = (self.pin_a.value() << 1) | self.pin_b.value()
+        self._steps_read = self._steps
+        self._clicks_read = self._clicks
+        self._state[0] = (self.pin_a.value() << 1) | self.pin_b.value()
+        self._state[1] = 4
         self._last_button = self.button.value()
         now = time.ticks_ms()
         self._last_step_time = now
@@ -144,18 +201,9 @@ class RotaryEncoder:
 
 
 def encoder_polling_loop(encoder, poll_frequency_hz=1000):
-    """Dedicated polling loop for encoder - runs on separate core.
-    
-    Args:
-        encoder: RotaryEncoder instance to poll
-        poll_frequency_hz: Polling frequency in Hz (default 5000Hz = 200us interval)
-                          Supports up to ~10kHz reliably with microsecond sleep
-    """
-    #poll_interval_us = int(1000000 / poll_frequency_hz)
-    poll_interval_us = int(1000 / poll_frequency_hz)
-    print("Encoder polling thread started - %dHz (%dus interval)" % (poll_frequency_hz, poll_interval_us))
-    while True:
-        encoder.update()
-        #time.sleep_us(poll_interval_us)
-        time.sleep_ms(poll_interval_us)
+    """No-op kept for API compatibility.
 
+    main.py polls encoder.update() from a periodic machine.Timer, so there
+    is no dedicated polling loop to run.
+    """
+    pass
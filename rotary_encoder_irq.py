@@ -8,6 +8,7 @@ Or copy rotary_irq_esp.py to your device.
 """
 
 from machine import Pin
+import time
 try:
     from rotary_irq_esp import RotaryIRQ
 except ImportError:
@@ -58,6 +59,7 @@ class RotaryEncoderIRQ:
         self._button_clicked = False
         self._last_button_value = self.button.value()
         self._button_press_time = None
+        self._click_time = 0  # ticks_ms() at the press of the last click
         
         # Attach button interrupt
         self.button.irq(trigger=Pin.IRQ_FALLING | Pin.IRQ_RISING, handler=self._button_handler)
@@ -71,7 +73,6 @@ class RotaryEncoderIRQ:
     
     def _button_handler(self, pin):
         """IRQ handler for button press/release."""
-        import time
         current = pin.value()
         now = time.ticks_ms()
         
@@ -81,6 +82,7 @@ class RotaryEncoderIRQ:
             if self._button_press_time is not None:
                 # Check debounce time
                 if time.ticks_diff(now, self._button_press_time) >= self._button_debounce_ms:
+                    self._click_time = self._button_press_time
                     self._button_clicked = True
                 self._button_press_time = None
     
@@ -88,6 +90,29 @@ class RotaryEncoderIRQ:
         """No-op for API compatibility. Hardware handles updates automatically."""
         pass
     
+    def is_pressed(self):
+        """True while the button is held down (press seen, release not yet)."""
+        return self._button_press_time is not None
+    
+    def pending(self):
+        """True if rotation or a click is waiting for read()."""
+        return self._button_clicked or self.rotary.value() != self._last_value
+    
+    def wait_click(self, timeout_ms):
+        """Wait up to timeout_ms for a click and consume it.
+        
+        Returns:
+            ticks_ms() value captured in the IRQ when the button went down,
+            or None on timeout
+        """
+        deadline = time.ticks_add(time.ticks_ms(), timeout_ms)
+        while not self._button_clicked:
+            if time.ticks_diff(deadline, time.ticks_ms()) <= 0:
+                return None
+            time.sleep_ms(1)
+        self._button_clicked = False
+        return self._click_time
+    
     def read(self):
         """Return accumulated (delta_steps, button_clicked) since last read.
         
@@ -120,8 +145,16 @@ class RotaryEncoderIRQ:
     
     def reset(self):
         """Clear any pending events and reset tracking."""
-        self.rotary.reset()
-        self._last_value = 0
+        try:
+            # RotaryIRQ.reset() resets to min_val
+            self.rotary.reset()
+        except Exception:
+            try:
+                self.rotary.set(value=0)
+            except Exception:
+                pass
+        value = self.rotary.value()
+        self._last_value = value if value is not None else 0
         self._button_clicked = False
         self._button_press_time = None
 
@@ -136,7 +169,6 @@ def encoder_polling_loop(encoder, poll_frequency_hz=1000):
         encoder: RotaryEncoderIRQ instance
         poll_frequency_hz: Polling frequency (default 1000Hz)
     """
-    import time
     poll_interval_ms = int(1000 / poll_frequency_hz)
     print("Encoder polling thread started (hardware PCNT mode) - %dHz" % poll_frequency_hz)
     while True:
@@ -1,29 +1,50 @@
 # sprites.py
 # Pet mood sprites: 5 moods × 2 frames each (64x64 ASCII art, centered)
 
+import micropython
 from micropython import const
 
+
+@micropython.viper
+def _pack_rows(src: ptr8, n: int, dst: ptr8, dims: int) -> int:
+    # Walks the ASCII art once; blank lines are skipped, short rows are
+    # left zero-padded. dims = width << 16 | height (viper takes at most
+    # 4 arguments). Returns the number of rows seen.
+    width = dims >> 16
+    height = dims & 0xFFFF
+    row_bytes = (width + 7) >> 3
+    y = 0
+    x = 0
+    i = 0
+    while i < n:
+        c = src[i]
+        if c == 10:
+            if x > 0:
+                y += 1
+            x = 0
+        else:
+            if x < width and c != 46 and y < height:
+                j = y * row_bytes + (x >> 3)
+                dst[j] = dst[j] | (128 >> (x & 7))
+            x += 1
+        i += 1
+    if x > 0:
+        y += 1
+    return y
+
+
+def _pack_ascii(frame, width, height):
+    buf = bytearray(((width + 7) // 8) * height)
+    rows = _pack_rows(frame, len(frame), buf, (width << 16) | height)
+    if rows != height:
+        raise ValueError("Frame height mismatch: expected %d, got %d" % (height, rows))
+    return buf
+
+
 def ascii_to_bitmap(frames_ascii, width, height):
     """Convert ASCII art frames to 1-bit bitmaps (row-major, MSB-first)"""
-    bitmaps = []
-    row_bytes = (width + 7) // 8
-    for frame in frames_ascii:
-        lines = [ln for ln in frame.split('\n') if ln != '']
-        if len(lines) != height:
-            raise ValueError("Frame height mismatch: expected %d, got %d" % (height, len(lines)))
-        buf = bytearray(row_bytes * height)
-        for y in range(height):
-            row = lines[y]
-            if len(row) < width:
-                row = row + '.' * (width - len(row))
-            for x in range(width):
-                bit = 1 if row[x] != '.' else 0
-                byte_index = y * row_bytes + (x // 8)
-                bit_pos = 7 - (x % 8)
-                if bit:
-                    buf[byte_index] |= (1 << bit_pos)
-        bitmaps.append(bytes(buf))
-    return bitmaps
+    # Kept as bytearray so main.py can wrap it in a FrameBuffer without a copy
+    return [_pack_ascii(frame, width, height) for frame in frames_ascii]
 
 
 # Pet dimensions (64x64 for max size on 128x64 screen)
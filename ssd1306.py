@@ -5,20 +5,26 @@
 import framebuf
 
 class SSD1306:
-    def __init__(self, width, height, external_vcc):
+    def __init__(self, width, height, external_vcc, col_offset=2):
         self.width = width
         self.height = height
         self.external_vcc = external_vcc
+        # RAM column of the first visible pixel: 2 for SH1106 panels (132
+        # column RAM, the 128 visible ones centred), 0 for a true SSD1306
+        self.col_offset = col_offset
         self.pages = self.height // 8
         self.buffer = bytearray(self.pages * self.width)
+        self._mv = memoryview(self.buffer)  # Slices of this share the buffer, no copy
+        self._page_cmd = bytearray((0xB0, 0x00, 0x10))  # Page, low column, high column
         self.framebuf = framebuf.FrameBuffer(self.buffer, self.width, self.height, framebuf.MONO_VLSB)
         self.poweron()
         self.init_display()
 
     def init_display(self):
-        for cmd in (
+        # The whole init sequence goes out as a single command transaction
+        self.write_cmds(bytes((
             0xAE,         # display off
-            0x20, 0x00,   # horizontal addressing
+            0x20, 0x02,   # page addressing (the only mode SH1106 has)
             0xB0,         # page addr base
             0xC8,         # COM scan dir remap
             0x00,         # low col start
@@ -35,8 +41,7 @@ class SSD1306:
             0xDA, 0x12,   # COM pins
             0xDB, 0x40,   # vcomh
             0x8D, 0x14 if not self.external_vcc else 0x10,  # charge pump
-            0xAF):        # display on
-            self.write_cmd(cmd)
+            0xAF)))       # display on
         self.fill(0)
         self.show()
 
@@ -47,20 +52,33 @@ class SSD1306:
         self.write_cmd(0xAE)
 
     def contrast(self, contrast):
-        self.write_cmd(0x81)
-        self.write_cmd(contrast)
+        self.write_cmds(bytes((0x81, contrast)))
 
     def invert(self, invert):
         self.write_cmd(0xA7 if invert else 0xA6)
 
     def show(self):
-        for page in range(0, self.pages):
-            self.write_cmd(0xB0 | page)
-            self.write_cmd(0x02)        # low col
-            self.write_cmd(0x10)        # hi col
-            start = page * self.width
-            end = start + self.width
-            self.write_data(self.buffer[start:end])
+        self.show_window(0, self.width - 1, 0, self.pages - 1)
+
+    def show_pages(self, page_start, page_end):
+        """Push full-width pages page_start..page_end (8 rows each)"""
+        self.show_window(0, self.width - 1, page_start, page_end)
+
+    def show_window(self, col_start, col_end, page_start, page_end):
+        """Push only columns col_start..col_end of pages page_start..page_end"""
+        # Page addressing doesn't wrap to the next page, so each page gets its
+        # page/column commands in one transaction and its data in another
+        cmd = self._page_cmd
+        col = col_start + self.col_offset
+        cmd[1] = col & 0x0F
+        cmd[2] = 0x10 | (col >> 4)
+        mv = self._mv
+        width = self.width
+        for page in range(page_start, page_end + 1):
+            cmd[0] = 0xB0 | page
+            self.write_cmds(cmd)
+            base = page * width
+            self.write_data(mv[base + col_start:base + col_end + 1])
 
     def fill(self, c):
         self.framebuf.fill(c)
@@ -74,28 +92,42 @@ class SSD1306:
     def text(self, s, x, y, c=1):
         self.framebuf.text(s, x, y, c)
 
+    def line(self, x1, y1, x2, y2, c=1):
+        self.framebuf.line(x1, y1, x2, y2, c)
+
     def rect(self, x, y, w, h, c=1):
         self.framebuf.rect(x, y, w, h, c)
 
     def fill_rect(self, x, y, w, h, c=1):
         self.framebuf.fill_rect(x, y, w, h, c)
 
+    def blit(self, fbuf, x, y, key=-1):
+        self.framebuf.blit(fbuf, x, y, key)
+
     # I2C/SPI specific in subclasses
     def write_cmd(self, cmd):
         raise NotImplementedError
 
+    def write_cmds(self, cmds):
+        raise NotImplementedError
+
     def write_data(self, buf):
         raise NotImplementedError
 
 
 class SSD1306_I2C(SSD1306):
-    def __init__(self, width, height, i2c, addr=0x3c, external_vcc=False):
+    def __init__(self, width, height, i2c, addr=0x3c, external_vcc=False, col_offset=2):
         self.i2c = i2c
         self.addr = addr
-        super().__init__(width, height, external_vcc)
+        super().__init__(width, height, external_vcc, col_offset)
 
     def write_cmd(self, cmd):
         self.i2c.writeto(self.addr, b'\x00' + bytearray([cmd]))
 
+    def write_cmds(self, cmds):
+        # Control byte 0x00 (Co=0): every following byte is a command
+        self.i2c.writevto(self.addr, (b'\x00', cmds))
+
     def write_data(self, buf):
-        self.i2c.writeto(self.addr, b'\x40' + buf)
+        # Gather control byte + payload in the driver instead of concatenating
+        self.i2c.writevto(self.addr, (b'\x40', buf))
@@ -3,7 +3,8 @@
 Upload files to ESP32 running MicroPython.
 
 This script uploads all necessary Python files to the ESP32 device.
-It tries mpremote first (recommended), then falls back to ampy if available.
+It uploads over a single raw REPL session when pyserial is installed, and
+otherwise uses mpremote (recommended), then falls back to ampy if available.
 
 Usage:
     python upload_to_esp32.py [port] [options]
@@ -16,21 +17,42 @@ Examples:
     python upload_to_esp32.py --check-storage  # Check storage after upload
     python upload_to_esp32.py --monitor  # View device logs after upload
     python upload_to_esp32.py --monitor --monitor-duration 30  # Monitor for 30 seconds
+    python upload_to_esp32.py --mpy  # Precompile with mpy-cross -O3 before upload
+    python upload_to_esp32.py --force  # Re-upload files that haven't changed
+    python upload_to_esp32.py --baud 921600  # Faster transfer over the raw REPL
+    python upload_to_esp32.py --reset  # Restart the device after upload
+    python upload_to_esp32.py --dry-run  # List what would be uploaded, no device needed
 """
 
 import sys
 import os
 import subprocess
 import argparse
+import base64
+import functools
+import hashlib
+import io
+import select
+import shutil
+import threading
+import time
 from pathlib import Path
 
+try:
+    # mpremote's CLI entry point, run in-process when available
+    import mpremote.main as _mpremote
+except ImportError:
+    _mpremote = None
+
 
 # Files to upload (in order - main.py should be last to run on boot)
 FILES_TO_UPLOAD = [
     "ssd1306.py",
     "sprites.py",
+    "digits.py",
     "menu.py",
     "rotary_encoder.py",
+    "rotary_encoder_irq.py",
     "config.py",
     "main.py",
     "minigame_a.py",
@@ -40,16 +62,53 @@ FILES_TO_UPLOAD = [
 ]
 
 # Files to skip
-FILES_TO_SKIP = [
+FILES_TO_SKIP = frozenset({
     "config.py.example",
     "image_to_ascii.py",
     "README.md",
     "upload_to_esp32.py",
-]
+})
+
+# FILES_TO_UPLOAD minus FILES_TO_SKIP, in upload order
+UPLOAD_CANDIDATES = [file for file in FILES_TO_UPLOAD if file not in FILES_TO_SKIP]
+
+# Files that stay as source with --mpy (config.py is edited on the device)
+MPY_KEEP_SOURCE = frozenset({
+    "config.py",
+})
+
+# main.py is compiled under this module name and started from a two-line main.py stub
+MPY_APP_MODULE = "app"
+MPY_BUILD_DIR = "build"
+# Needed for the @micropython.viper/native functions (xtensawin = ESP32)
+MPY_ARCH = "xtensawin"
+
+# Rate the MicroPython REPL runs at on UART0
+REPL_BAUD = 115200
+
+# Device-side filesystem query for --check-storage; prints "used,free,total" bytes
+STORAGE_CODE = "import os; s=os.statvfs('/'); b=s[0]; t=s[2]*b; f=s[3]*b; u=t-f; print(f'{u},{f},{t}')"
+
+# Last auto-detected port (only confirmed ESP32 matches are cached)
+PORT_CACHE = Path.home() / ".cache" / "esp32_upload_port"
+
+# Longest the serial monitor holds back a partial line before flushing it
+MONITOR_FLUSH_S = 0.05
 
 
 def find_esp32_port():
-    """Try to automatically detect ESP32 serial port."""
+    """Try to automatically detect ESP32 serial port.
+
+    The last detected port is cached in PORT_CACHE and reused while its
+    device node still exists, skipping the port enumeration.
+    """
+    try:
+        cached = PORT_CACHE.read_text().strip()
+        if cached and os.path.exists(cached):
+            return cached
+    except OSError:
+        pass
+    
     import serial.tools.list_ports
     
     # Common ESP32 vendor IDs
@@ -58,6 +117,11 @@ def find_esp32_port():
     ports = serial.tools.list_ports.comports()
     for port in ports:
         if port.vid in esp32_vids or 'ESP32' in port.description.upper() or 'CP210' in port.description.upper():
+            try:
+                PORT_CACHE.parent.mkdir(parents=True, exist_ok=True)
+                PORT_CACHE.write_text(port.device)
+            except OSError:
+                pass
             return port.device
     
     # Fallback: list all ports
@@ -70,48 +134,534 @@ def find_esp32_port():
     return None
 
 
+@functools.lru_cache(maxsize=None)
 def check_command(command):
-    """Check if a command is available."""
+    """Check if a command is available.
+
+    A PATH lookup rather than running `command --version`, which costs a
+    full interpreter start for the Python-based tools; cached since main()
+    and check_storage() ask about the same tools.
+    """
+    return shutil.which(command) is not None
+
+
+def has_mpremote():
+    """Check if mpremote is importable or on PATH."""
+    return _mpremote is not None or check_command("mpremote")
+
+
+def run_mpremote(args, timeout):
+    """Run `mpremote *args` and return a CompletedProcess with text output.
+
+    When mpremote is importable its main() runs in this process, which
+    skips starting a second interpreter (and re-importing serial) per call.
+    Raises subprocess.TimeoutExpired after `timeout` seconds either way.
+    """
+    global _mpremote
+    if _mpremote is None:
+        return subprocess.run(["mpremote", *args],
+                              capture_output=True, text=True, timeout=timeout)
+    
+    # mpremote writes device output to sys.stdout.buffer, so give it one
+    stdout = io.TextIOWrapper(io.BytesIO(), encoding="utf-8", errors="replace")
+    stderr = io.StringIO()
+    result = {}
+    
+    def call():
+        try:
+            result["returncode"] = _mpremote.main()
+        except SystemExit as e:
+            result["returncode"] = e.code if isinstance(e.code, int) else int(e.code is not None)
+        except Exception as e:
+            result["returncode"] = 1
+            stderr.write(str(e))
+    
+    # main() blocks on the serial port with no timeout of its own, so it runs
+    # on a worker thread that can be abandoned. The redirects are swapped and
+    # restored here, not in the worker, so an abandoned call can't undo them
+    # under a later one
+    saved = sys.argv, sys.stdout, sys.stderr
+    sys.argv, sys.stdout, sys.stderr = ["mpremote", *args], stdout, stderr
     try:
-        subprocess.run([command, "--version"], 
-                      capture_output=True, 
-                      check=True, 
-                      timeout=5)
-        return True
-    except (subprocess.CalledProcessError, FileNotFoundError, subprocess.TimeoutExpired):
+        worker = threading.Thread(target=call, daemon=True)
+        worker.start()
+        worker.join(timeout)
+    finally:
+        sys.argv, sys.stdout, sys.stderr = saved
+    
+    if worker.is_alive():
+        # The stuck call keeps its port handle until the script exits; later
+        # calls go through the CLI, which can be killed on timeout
+        _mpremote = None
+        raise subprocess.TimeoutExpired(["mpremote", *args], timeout)
+    stdout.flush()
+    return subprocess.CompletedProcess(
+        ["mpremote", *args], result["returncode"],
+        stdout.buffer.getvalue().decode("utf-8", errors="replace"), stderr.getvalue())
+
+
+def _set_low_latency(port):
+    """Ask the USB-serial driver to hand over bytes immediately.
+
+    FTDI-style adapters batch input for latency_timer ms (16 by default)
+    before passing it on, which dominates round trips for short REPL
+    replies. Linux only; failures (no permission, adapter without the
+    setting, no setserial) are ignored.
+    """
+    if not sys.platform.startswith("linux"):
+        return
+    tty = os.path.basename(os.path.realpath(port))
+    try:
+        with open(f"/sys/bus/usb-serial/devices/{tty}/latency_timer", "w") as f:
+            f.write("1")
+    except OSError:
+        pass
+    try:
+        subprocess.run(["setserial", port, "low_latency"],
+                       capture_output=True, timeout=5)
+    except (OSError, subprocess.TimeoutExpired):
+        pass
+
+
+def compile_mpy(files, build_dir=MPY_BUILD_DIR):
+    """Precompile files with mpy-cross -O3.
+
+    Returns (files_to_upload, stale_sources): the list to upload in place of
+    `files`, and the .py names to delete on the device so they don't shadow
+    the new .mpy files (MicroPython imports .py before .mpy).
+    """
+    os.makedirs(build_dir, exist_ok=True)
+    compiled = []
+    stale = []
+    for file in files:
+        if file in MPY_KEEP_SOURCE:
+            compiled.append(file)
+            continue
+
+        module = MPY_APP_MODULE if file == "main.py" else Path(file).stem
+        output = os.path.join(build_dir, f"{module}.mpy")
+        print(f"🔧 Compiling {file} -> {output}...", end=" ", flush=True)
+        result = subprocess.run(
+            ["mpy-cross", "-O3", f"-march={MPY_ARCH}", "-o", output, file],
+            capture_output=True,
+            text=True,
+            timeout=30
+        )
+        if result.returncode != 0:
+            print(f"✗ Error: {result.stderr}")
+            sys.exit(1)
+        print("✓")
+        compiled.append(output)
+
+        if file == "main.py":
+            # Boot only runs main.py, so keep a stub that imports the compiled app
+            stub = os.path.join(build_dir, "main.py")
+            with open(stub, "w") as f:
+                f.write(f"import {MPY_APP_MODULE}\n{MPY_APP_MODULE}.main()\n")
+            compiled.append(stub)
+        else:
+            stale.append(file)
+
+    return compiled, stale
+
+
+def remove_code(files):
+    """Device-side snippet deleting files, ignoring ones that don't exist."""
+    return f"import os\nfor f in {tuple(files)!r}:\n try: os.remove(f)\n except OSError: pass"
+
+
+def remote_hash_code(files):
+    """Device-side snippet printing "name sha256" per file ("name -" if missing).
+
+    Files are hashed in 512-byte reads so main.py doesn't need one big
+    allocation on the device.
+    """
+    names = tuple(os.path.basename(file) for file in files)
+    return (
+        f"import hashlib,binascii\nfor n in {names!r}:\n"
+        " try:\n"
+        "  h=hashlib.sha256();f=open(n,'rb')\n"
+        "  while 1:\n"
+        "   b=f.read(512)\n"
+        "   if not b:break\n"
+        "   h.update(b)\n"
+        "  f.close();print(n,binascii.hexlify(h.digest()).decode())\n"
+        " except OSError:print(n,'-')"
+    )
+
+
+def local_sha256(path):
+    """Hex SHA-256 of a local file, comparable with remote_hash_code() output."""
+    with open(path, "rb") as f:
+        return hashlib.sha256(f.read()).hexdigest()
+
+
+def changed_files(files, listing):
+    """Drop files whose SHA-256 matches the device copy.
+
+    `listing` is the output of running remote_hash_code(files) on the device.
+    """
+    remote = {}
+    for line in listing.splitlines():
+        parts = line.split()
+        if len(parts) == 2:
+            remote[parts[0]] = parts[1]
+    
+    changed = []
+    for file in files:
+        if remote.get(os.path.basename(file)) == local_sha256(file):
+            print(f"⏭️  {file} unchanged")
+        else:
+            changed.append(file)
+    return changed
+
+
+def remove_remote_files_ampy(port, files):
+    """Delete files on the device with ampy, ignoring ones that don't exist."""
+    for file in files:
+        subprocess.run(["ampy", "--port", port, "rm", file],
+                       capture_output=True, text=True, timeout=10)
+
+
+class RawReplError(Exception):
+    """The device didn't answer the raw REPL protocol as expected."""
+
+
+class RawRepl:
+    """Minimal MicroPython raw REPL session over pyserial.
+
+    Opens the port once and keeps the board in raw REPL mode, so several
+    commands (file writes, deletes, queries) share one connection instead
+    of paying a connect/handshake per tool invocation.
+    """
+
+    def __init__(self, port, baudrate=REPL_BAUD, timeout=10):
+        import serial
+        _set_low_latency(port)
+        self.serial = serial.Serial(port, baudrate, timeout=timeout)
+        self.timeout = timeout
+        self.repl_baud = baudrate
+        # Use flow-controlled raw-paste mode until the device turns it down
+        self.raw_paste = True
+
+    def close(self):
+        try:
+            if self.serial.baudrate != self.repl_baud:
+                # Leave the board at the rate everything else expects
+                self._switch_device_baud(self.repl_baud)
+            self.serial.write(b"\r\x02")  # Ctrl-B: back to the friendly REPL
+        finally:
+            self.serial.close()
+
+    def __enter__(self):
+        try:
+            self.enter()
+        except BaseException:
+            # __exit__ won't run, and the fallback tools need the port
+            self.serial.close()
+            raise
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def read_until(self, ending):
+        """Read until `ending` (inclusive); raises RawReplError on timeout."""
+        data = b""
+        deadline = time.monotonic() + self.timeout
+        while not data.endswith(ending):
+            chunk = self.serial.read(1)
+            if chunk:
+                data += chunk
+            elif time.monotonic() > deadline:
+                raise RawReplError(f"timed out waiting for {ending!r}, got {data[-80:]!r}")
+        return data
+
+    def enter(self):
+        # Ctrl-C twice stops main.py, Ctrl-A switches to raw mode
+        self.serial.write(b"\r\x03\x03")
+        self.serial.reset_input_buffer()
+        self.serial.write(b"\r\x01")
+        self.read_until(b"raw REPL; CTRL-B to exit\r\n>")
+
+    def set_baudrate(self, baudrate):
+        """Move the board's REPL UART, and this connection, to `baudrate`.
+
+        Returns False and stays at the current rate if the firmware won't
+        re-init UART(0) or the link doesn't come up at the new rate.
+        """
+        previous = self.serial.baudrate
+        self._switch_device_baud(baudrate)
+        if self._resync():
+            return True
+        self.serial.baudrate = previous
+        if not self._resync():
+            raise RawReplError(f"lost the board after switching to {baudrate} baud; reset it")
         return False
 
+    def _switch_device_baud(self, baudrate):
+        # The reply to this command goes out at the new rate (or, if UART(0)
+        # can't be re-initialised, as an error at the old one), so only the
+        # "OK" is read before the host side follows
+        self._write_raw(f"import machine\nmachine.UART(0,{baudrate})".encode())
+        time.sleep(0.1)
+        self.serial.baudrate = baudrate
+        self.serial.reset_input_buffer()
+
+    def _resync(self):
+        """Re-enter raw mode at the current host rate; False on timeout."""
+        timeout, self.timeout = self.timeout, 1
+        try:
+            self.enter()
+            return True
+        except RawReplError:
+            return False
+        finally:
+            self.timeout = timeout
+
+    def exec(self, code):
+        """Run code on the device and return its stdout as bytes."""
+        if isinstance(code, str):
+            code = code.encode()
+        if not (self.raw_paste and self._write_raw_paste(code)):
+            self._write_raw(code)
+        out = self.read_until(b"\x04")[:-1]
+        err = self.read_until(b"\x04")[:-1]
+        self.read_until(b">")
+        if err:
+            raise RawReplError(err.decode(errors="replace").strip())
+        return out
+
+    def _write_raw(self, code):
+        # Plain raw mode has no flow control: feed the device's UART buffer
+        # in small pieces like pyboard.py does
+        for i in range(0, len(code), 256):
+            self.serial.write(code[i:i + 256])
+            time.sleep(0.01)
+        self.serial.write(b"\x04")
+        if self.serial.read(2) != b"OK":
+            raise RawReplError("device did not accept the command")
+
+    def _write_raw_paste(self, code):
+        """Send code in raw-paste mode; False if the firmware lacks it.
+
+        The device grants a window of bytes it can buffer and tops it up
+        with a 0x01 byte as it consumes them, so the host keeps data in flight
+        instead of sleeping between fixed-size pieces.
+        """
+        self.serial.write(b"\x05A\x01")
+        reply = self.serial.read(2)
+        if reply != b"R\x01":
+            if reply != b"R\x00":
+                # Older firmware treats it as input; wait for its prompt
+                self.read_until(b"w REPL; CTRL-B to exit\r\n>")
+            self.raw_paste = False
+            return False
+        window = int.from_bytes(self.serial.read(2), "little")
+        remaining = window
+        i = 0
+        while i < len(code):
+            while remaining == 0 or self.serial.in_waiting:
+                flow = self.serial.read(1)
+                if flow == b"\x01":
+                    remaining += window
+                elif flow == b"\x04":
+                    # Device aborted the paste (e.g. out of memory)
+                    self.serial.write(b"\x04")
+                    self.read_until(b"\x04")
+                    raise RawReplError("device ended the raw paste early")
+                else:
+                    raise RawReplError(f"unexpected {flow!r} during raw paste")
+            piece = code[i:i + remaining]
+            self.serial.write(piece)
+            remaining -= len(piece)
+            i += len(piece)
+        self.serial.write(b"\x04")
+        self.read_until(b"\x04")  # Compiled; execution output follows
+        return True
+
+    def put(self, local_path, remote_name, chunk_size=1024, chunks_per_exec=4):
+        """Copy a local file to the device root.
+
+        Several base64 chunks go into each exec to cut the per-command round
+        trips; chunk_size * chunks_per_exec bounds the device RAM needed.
+        """
+        with open(local_path, "rb") as f:
+            data = f.read()
+        self.exec(f"from binascii import a2b_base64 as d\nf=open({remote_name!r},'wb')\nw=f.write")
+        step = chunk_size * chunks_per_exec
+        for i in range(0, len(data), step):
+            self.exec(b"\n".join(
+                b"w(d(b'" + base64.b64encode(data[j:j + chunk_size]) + b"'))"
+                for j in range(i, min(i + step, len(data)), chunk_size)
+            ))
+        self.exec("f.close()")
+
+
+class UploadProgress:
+    """Upload status for a list of files, kept to one line on a terminal.
+
+    On a TTY the line is rewritten in place with the file count and byte
+    rate; otherwise only errors and the final summary are printed.
+    """
+
+    def __init__(self, files):
+        self.total = len(files)
+        self.index = 0
+        self.uploaded = 0
+        self.bytes = 0
+        self.tty = sys.stdout.isatty()
+        self.start = time.monotonic()
+
+    def _rate(self):
+        elapsed = time.monotonic() - self.start
+        return f"{self.bytes / 1024 / elapsed:.1f} KB/s" if elapsed > 0 else "-"
+
+    def _clear(self):
+        if self.tty:
+            sys.stdout.write("\r\x1b[K")
+
+    def begin(self, file):
+        self.index += 1
+        if self.tty:
+            self._clear()
+            sys.stdout.write(f"📤 [{self.index}/{self.total}] {file}  {self._rate()}")
+            sys.stdout.flush()
+
+    def ok(self, file):
+        self.uploaded += 1
+        self.bytes += os.path.getsize(file)
+
+    def error(self, file, message):
+        self._clear()
+        print(f"✗ {file}: {message}")
+
+    def finish(self):
+        self._clear()
+        elapsed = time.monotonic() - self.start
+        print(f"📤 Uploaded {self.uploaded}/{self.total} files "
+              f"({self.bytes / 1024:.1f} KB) in {elapsed:.1f}s, {self._rate()}")
 
-def upload_with_mpremote(port, files):
-    """Upload files using mpremote."""
+
+def upload_with_raw_repl(port, files, remove=(), force=False, baud=None):
+    """Upload files over one pyserial raw REPL session.
+
+    Unless `force` is set, files whose contents already match the device
+    are skipped. With `baud`, the board's UART is switched to that rate for
+    the transfer and back to REPL_BAUD afterwards. Raises RawReplError (or
+    serial.SerialException) if the session can't be set up, so the caller
+    can fall back to mpremote.
+    """
+    print(f"Using raw REPL to upload to {port}...")
+    failed = []
+    with RawRepl(port) as repl:
+        if baud and baud != REPL_BAUD:
+            if repl.set_baudrate(baud):
+                print(f"⚡ Switched to {baud} baud")
+            else:
+                print(f"⚠️  Board did not come up at {baud} baud, staying at {REPL_BAUD}")
+        if remove:
+            print(f"🧹 Removing stale sources: {', '.join(remove)}")
+            repl.exec(remove_code(remove))
+        if not force:
+            try:
+                listing = repl.exec(remote_hash_code(files)).decode(errors="replace")
+                files = changed_files(files, listing)
+            except RawReplError as e:
+                print(f"⚠️  Could not compare with the device ({e}), uploading everything")
+        progress = UploadProgress(files)
+        for file in files:
+            progress.begin(file)
+            try:
+                repl.put(file, os.path.basename(file))
+                progress.ok(file)
+            except RawReplError as e:
+                progress.error(file, e)
+                failed.append(file)
+        progress.finish()
+    return failed
+
+
+def upload_with_mpremote(port, files, remove=(), force=False):
+    """Upload files using mpremote.
+
+    Unless `force` is set, one exec first asks the device for its file
+    hashes and files that already match are skipped. Deleting `remove` and
+    copying the rest happen in one mpremote session (commands chained with
+    "+"), so the serial connection and raw REPL handshake happen once. If
+    that fails, each file is retried on its own so failures can be
+    reported per file.
+    """
     print(f"Using mpremote to upload to {port}...")
     
+    if not force:
+        try:
+            result = run_mpremote(["connect", port, "exec", remote_hash_code(files)], timeout=30)
+            if result.returncode == 0:
+                files = changed_files(files, result.stdout)
+        except (subprocess.TimeoutExpired, OSError):
+            pass
+    
+    session = ["connect", port]
+    if remove:
+        print(f"🧹 Removing stale sources: {', '.join(remove)}")
+        session += ["exec", remove_code(remove), "+"]
+    
+    if not files:
+        if remove:
+            try:
+                run_mpremote(session[:-1], timeout=10)
+            except (subprocess.TimeoutExpired, OSError) as e:
+                print(f"⚠️  Could not remove stale sources: {e}")
+        return []
+    
+    print(f"📤 Uploading {', '.join(files)}...", end=" ", flush=True)
+    try:
+        # A trailing ":" copies every source into the device root by basename
+        result = run_mpremote(session + ["cp", *files, ":"], timeout=30 * len(files))
+        
+        if result.returncode == 0:
+            print("✓")
+            return []
+        print(f"✗ Error: {result.stderr}")
+    except subprocess.TimeoutExpired:
+        print("✗ Timeout")
+    except Exception as e:
+        print(f"✗ Error: {e}")
+    
+    print("Retrying one file at a time...")
+    return _upload_each_with_mpremote(port, files, remove)
+
+
+def _upload_each_with_mpremote(port, files, remove=()):
+    """Upload files with one mpremote process each; returns the failures."""
+    if remove:
+        try:
+            run_mpremote(["connect", port, "exec", remove_code(remove)], timeout=10)
+        except (subprocess.TimeoutExpired, OSError) as e:
+            print(f"⚠️  Could not remove stale sources: {e}")
     failed = []
+    progress = UploadProgress(files)
     for file in files:
-        if not os.path.exists(file):
-            print(f"⚠️  Warning: {file} not found, skipping...")
-            continue
-        
-        print(f"📤 Uploading {file}...", end=" ", flush=True)
+        progress.begin(file)
         try:
-            result = subprocess.run(
-                ["mpremote", "connect", port, "cp", file, f":{file}"],
-                capture_output=True,
-                text=True,
+            result = run_mpremote(
+                ["connect", port, "cp", file, f":{os.path.basename(file)}"],
                 timeout=30
             )
             
             if result.returncode == 0:
-                print("✓")
+                progress.ok(file)
             else:
-                print(f"✗ Error: {result.stderr}")
+                progress.error(file, result.stderr.strip())
                 failed.append(file)
         except subprocess.TimeoutExpired:
-            print("✗ Timeout")
+            progress.error(file, "Timeout")
             failed.append(file)
         except Exception as e:
-            print(f"✗ Error: {e}")
+            progress.error(file, e)
             failed.append(file)
+    progress.finish()
     
     return failed
 
@@ -121,12 +671,9 @@ def upload_with_ampy(port, files):
     print(f"Using ampy to upload to {port}...")
     
     failed = []
+    progress = UploadProgress(files)
     for file in files:
-        if not os.path.exists(file):
-            print(f"⚠️  Warning: {file} not found, skipping...")
-            continue
-        
-        print(f"📤 Uploading {file}...", end=" ", flush=True)
+        progress.begin(file)
         try:
             result = subprocess.run(
                 ["ampy", "--port", port, "put", file],
@@ -136,16 +683,17 @@ def upload_with_ampy(port, files):
             )
             
             if result.returncode == 0:
-                print("✓")
+                progress.ok(file)
             else:
-                print(f"✗ Error: {result.stderr}")
+                progress.error(file, result.stderr.strip())
                 failed.append(file)
         except subprocess.TimeoutExpired:
-            print("✗ Timeout")
+            progress.error(file, "Timeout")
             failed.append(file)
         except Exception as e:
-            print(f"✗ Error: {e}")
+            progress.error(file, e)
             failed.append(file)
+    progress.finish()
     
     return failed
 
@@ -154,35 +702,61 @@ def monitor_serial(port, duration=None):
     """Monitor serial output from the ESP32."""
     try:
         import serial
-        import time
         
         print(f"\n📟 Connecting to serial monitor on {port}...")
         print("=" * 60)
         print("Press Ctrl+C to exit\n")
         
-        ser = serial.Serial(port, 115200, timeout=1)
-        start_time = time.time()
+        _set_low_latency(port)
+        # On POSIX, select() sleeps until bytes arrive or exactly until the
+        # next deadline; elsewhere a short read timeout stands in for it
+        use_select = os.name == "posix"
+        ser = serial.Serial(port, REPL_BAUD, timeout=0 if use_select else 0.1)
+        start_time = time.monotonic()
+        deadline = start_time + duration if duration else None
+        # Raw bytes straight to the terminal, flushed per line (or after
+        # MONITOR_FLUSH_S for partial lines) rather than after every read
+        out = sys.stdout.buffer
+        sys.stdout.flush()
+        last_flush = start_time
+        unflushed = False
         
         try:
             while True:
-                if ser.in_waiting > 0:
-                    data = ser.read(ser.in_waiting)
-                    try:
-                        print(data.decode('utf-8'), end='', flush=True)
-                    except UnicodeDecodeError:
-                        # Handle binary data gracefully
-                        print(data.decode('utf-8', errors='replace'), end='', flush=True)
+                # Wake for data, the duration deadline, or a pending flush
+                wait = None if deadline is None else max(0, deadline - time.monotonic())
+                if unflushed:
+                    wait = MONITOR_FLUSH_S if wait is None else min(wait, MONITOR_FLUSH_S)
+                
+                if use_select:
+                    ready, _, _ = select.select([ser.fileno()], [], [], wait)
+                    data = ser.read(ser.in_waiting or 1) if ready else b''
+                else:
+                    ser.timeout = 0.1 if wait is None else min(0.1, wait)
+                    # Block for the first byte, then take whatever else arrived
+                    data = ser.read(1)
+                    if data and ser.in_waiting:
+                        data += ser.read(ser.in_waiting)
+                
+                now = time.monotonic()
+                if data:
+                    out.write(data)
+                    unflushed = True
+                if unflushed and (b'\n' in data or not data or now - last_flush >= MONITOR_FLUSH_S):
+                    out.flush()
+                    last_flush = now
+                    unflushed = False
                 
                 # If duration is set, exit after that time
-                if duration and (time.time() - start_time) >= duration:
+                if deadline is not None and now >= deadline:
                     break
-                    
-                time.sleep(0.01)  # Small delay to prevent CPU spinning
                 
         except KeyboardInterrupt:
+            out.flush()
             print("\n\n" + "=" * 60)
             print("Serial monitor closed")
         finally:
+            out.flush()
             ser.close()
             
     except ImportError:
@@ -199,43 +773,114 @@ def monitor_serial(port, duration=None):
     return True
 
 
+def try_hardware_reset(port):
+    """Reset the board with one EN pulse through the adapter's RTS line.
+
+    Returns False if pyserial is missing or the port can't be opened.
+    """
+    try:
+        import serial
+        ser = serial.Serial()
+        ser.port = port
+        ser.baudrate = REPL_BAUD
+        # Set the lines before opening so the open itself doesn't glitch EN
+        # or pull IO0 low (which would boot into the ROM downloader)
+        ser.dtr = False
+        ser.rts = False
+        ser.open()
+        try:
+            ser.rts = True   # EN low: hold in reset
+            time.sleep(0.05)
+            ser.rts = False  # EN high: boot from flash
+            time.sleep(0.05)
+        finally:
+            ser.close()
+        return True
+    except (ImportError, OSError):
+        return False
+
+
+def soft_reset(port):
+    """Soft-reboot from the friendly REPL so boot.py and main.py run again.
+
+    Works on boards without the auto-reset circuit (e.g. native USB), where
+    toggling RTS does nothing. Returns False if the port can't be opened.
+    """
+    try:
+        import serial
+        with serial.Serial(port, REPL_BAUD, timeout=1) as ser:
+            # Ctrl-C stops the program, Ctrl-B leaves raw REPL if a tool
+            # left it there, Ctrl-D soft-reboots
+            ser.write(b"\r\x03\x03\x02\x04")
+        return True
+    except (ImportError, OSError):
+        return False
+
+
+def restart_esp32(port, soft=False):
+    """Restart the board so it runs the new main.py.
+
+    A hardware reset pulse is tried first; `mpremote reset` is only used if
+    that can't be done. soft=True does a REPL soft reboot instead.
+    """
+    print("\n🔄 Restarting ESP32...", end=" ", flush=True)
+    if soft:
+        ok = soft_reset(port)
+    else:
+        ok = try_hardware_reset(port)
+        if not ok and has_mpremote():
+            try:
+                ok = run_mpremote(["connect", port, "reset"], timeout=10).returncode == 0
+            except (subprocess.TimeoutExpired, OSError):
+                ok = False
+    
+    if ok:
+        print("✓")
+    else:
+        print("⚠️  Could not restart the device, reset it manually")
+    return ok
+
+
 def check_storage(port):
-    """Check ESP32 filesystem storage usage."""
+    """Check ESP32 filesystem storage usage.
+
+    Asks over a raw REPL session when pyserial is available, which costs one
+    round trip instead of an mpremote run; mpremote is the fallback.
+    """
     print("\nChecking storage...", end=" ", flush=True)
     
     try:
-        if check_command("mpremote"):
-            # Execute Python code on device to get filesystem stats
-            result = subprocess.run(
-                ["mpremote", "connect", port, "exec",
-                 "import os; s=os.statvfs('/'); b=s[0]; t=s[2]*b; f=s[3]*b; u=t-f; print(f'{u},{f},{t}')"],
-                capture_output=True,
-                text=True,
-                timeout=10
-            )
-            
-            if result.returncode == 0:
-                output = result.stdout.strip()
-                # Parse the output: used,free,total
-                try:
-                    used, free, total = map(int, output.split(','))
-                    used_mb = used / (1024 * 1024)
-                    free_mb = free / (1024 * 1024)
-                    total_mb = total / (1024 * 1024)
-                    used_percent = (used / total * 100) if total > 0 else 0
-                    
-                    print("✓")
-                    print(f"   Used:  {used_mb:.2f} MB / {total_mb:.2f} MB ({used_percent:.1f}%)")
-                    print(f"   Free:  {free_mb:.2f} MB")
-                    return True
-                except (ValueError, IndexError) as e:
-                    print(f"⚠️  Could not parse storage info: {e}")
-                    return False
-            else:
+        output = None
+        try:
+            with RawRepl(port) as repl:
+                output = repl.exec(STORAGE_CODE).decode().strip()
+        except (ImportError, RawReplError, OSError):
+            pass
+        
+        if output is None:
+            if not has_mpremote():
+                print("⚠️  mpremote not available")
+                return False
+            result = run_mpremote(["connect", port, "exec", STORAGE_CODE], timeout=10)
+            if result.returncode != 0:
                 print("⚠️  Could not retrieve storage info")
                 return False
-        else:
-            print("⚠️  mpremote not available")
+            output = result.stdout.strip()
+        
+        # Parse the output: used,free,total
+        try:
+            used, free, total = map(int, output.split(','))
+            used_mb = used / (1024 * 1024)
+            free_mb = free / (1024 * 1024)
+            total_mb = total / (1024 * 1024)
+            used_percent = (used / total * 100) if total > 0 else 0
+            
+            print("✓")
+            print(f"   Used:  {used_mb:.2f} MB / {total_mb:.2f} MB ({used_percent:.1f}%)")
+            print(f"   Free:  {free_mb:.2f} MB")
+            return True
+        except (ValueError, IndexError) as e:
+            print(f"⚠️  Could not parse storage info: {e}")
             return False
     except Exception as e:
         print(f"⚠️  Error checking storage: {e}")
@@ -255,9 +900,12 @@ Examples:
   python upload_to_esp32.py --monitor
   python upload_to_esp32.py --monitor --monitor-duration 30
   python upload_to_esp32.py --skip-config --monitor --check-storage
+  python upload_to_esp32.py --mpy
+  python upload_to_esp32.py --reset --monitor
   
-Note: The device does not automatically restart. You'll need to manually
-restart it or it will auto-run main.py on the next boot.
+Note: Without --reset or --soft-reset the device does not automatically
+restart. You'll need to manually restart it or it will auto-run main.py on
+the next boot.
         """
     )
     parser.add_argument(
@@ -286,14 +934,45 @@ restart it or it will auto-run main.py on the next boot.
         metavar="SECONDS",
         help="Auto-exit serial monitor after N seconds (default: infinite, exit with Ctrl+C)"
     )
+    parser.add_argument(
+        "--reset",
+        action="store_true",
+        help="Hardware-reset the device after upload (pulses EN through RTS)"
+    )
+    parser.add_argument(
+        "--soft-reset",
+        action="store_true",
+        help="Soft-reboot the device after upload (Ctrl-D at the REPL), for boards without auto-reset"
+    )
+    parser.add_argument(
+        "--force",
+        action="store_true",
+        help="Upload every file, even ones whose contents already match the device"
+    )
+    parser.add_argument(
+        "--baud",
+        type=int,
+        metavar="RATE",
+        help=f"Switch the board's UART to RATE (e.g. 921600) for raw REPL uploads; "
+             f"it is put back to {REPL_BAUD} afterwards"
+    )
+    parser.add_argument(
+        "--dry-run",
+        action="store_true",
+        help="List what would be uploaded, with sizes and hashes, without opening the port"
+    )
+    parser.add_argument(
+        "--mpy",
+        action="store_true",
+        help="Precompile with mpy-cross -O3 and upload .mpy files (faster boot, less RAM)"
+    )
     
     args = parser.parse_args()
     
     # Determine port
     port = args.port
-    if not port:
+    if not port and not args.dry_run:
         try:
-            import serial.tools.list_ports
             port = find_esp32_port()
             if not port:
                 print("❌ Could not auto-detect ESP32 port.")
@@ -307,17 +986,17 @@ restart it or it will auto-run main.py on the next boot.
             print("  python upload_to_esp32.py /dev/cu.usbserial-0001")
             sys.exit(1)
     
-    # Check which files exist
+    # Check which files exist with one directory read instead of a stat per file;
+    # the upload functions trust this list and don't check again
+    present = {entry.name for entry in os.scandir(".")}
+    wanted = UPLOAD_CANDIDATES
+    if args.skip_config:
+        print("⏭️  Skipping config.py (--skip-config flag)")
+        wanted = [file for file in wanted if file != "config.py"]
+    
     files_to_upload = []
-    for file in FILES_TO_UPLOAD:
-        if args.skip_config and file == "config.py":
-            print(f"⏭️  Skipping {file} (--skip-config flag)")
-            continue
-        
-        if file in FILES_TO_SKIP:
-            continue
-        
-        if os.path.exists(file):
+    for file in wanted:
+        if file in present:
             files_to_upload.append(file)
         else:
             print(f"⚠️  Warning: {file} not found")
@@ -326,21 +1005,56 @@ restart it or it will auto-run main.py on the next boot.
         print("❌ No files to upload!")
         sys.exit(1)
     
+    stale_sources = []
+    if args.mpy:
+        if not check_command("mpy-cross"):
+            print("❌ mpy-cross not found! Install it with: pip install mpy-cross")
+            sys.exit(1)
+        files_to_upload, stale_sources = compile_mpy(files_to_upload)
+    
+    if args.dry_run:
+        total = 0
+        print(f"\n📋 Would upload ({len(files_to_upload)}):")
+        for file in files_to_upload:
+            size = os.path.getsize(file)
+            total += size
+            print(f"  - {file:<24} {size:>7} B  sha256 {local_sha256(file)[:12]}")
+        if stale_sources:
+            print(f"🧹 Would remove: {', '.join(stale_sources)}")
+        print(f"\nTotal: {total / 1024:.1f} KB (dry run: device not contacted, so files "
+              f"that already match it are listed too)")
+        return
+    
     print(f"\n📋 Files to upload ({len(files_to_upload)}):")
     for file in files_to_upload:
         print(f"  - {file}")
     print()
     
-    # Check for required commands
-    use_mpremote = check_command("mpremote")
-    if use_mpremote:
-        failed = upload_with_mpremote(port, files_to_upload)
+    # Prefer one raw REPL session over pyserial; fall back to the CLI tools
+    failed = None
+    try:
+        failed = upload_with_raw_repl(port, files_to_upload, remove=stale_sources,
+                                      force=args.force, baud=args.baud)
+    except ImportError:
+        pass
+    except Exception as e:
+        print(f"⚠️  Raw REPL upload unavailable ({e}), trying mpremote...")
+    
+    if failed is not None:
+        pass  # Raw REPL session handled it
+    elif has_mpremote():
+        failed = upload_with_mpremote(port, files_to_upload, remove=stale_sources,
+                                      force=args.force)
     elif check_command("ampy"):
         print("⚠️  mpremote not found, using ampy instead...")
+        if stale_sources:
+            print(f"🧹 Removing stale sources: {', '.join(stale_sources)}")
+            remove_remote_files_ampy(port, stale_sources)
         failed = upload_with_ampy(port, files_to_upload)
     else:
-        print("❌ Neither mpremote nor ampy found!")
+        print("❌ Neither pyserial, mpremote nor ampy found!")
         print("\nPlease install one of the following:")
+        print("  pip install pyserial  (direct raw REPL upload)")
         print("  pip install mpremote  (recommended)")
         print("  pip install adafruit-ampy")
         sys.exit(1)
@@ -359,8 +1073,15 @@ restart it or it will auto-run main.py on the next boot.
         if args.check_storage:
             check_storage(port)
         
+        restarted = False
+        if args.reset or args.soft_reset:
+            restarted = restart_esp32(port, soft=args.soft_reset)
+        
         print(f"\n📝 Next steps:")
-        print(f"  1. Restart manually or the device will auto-run main.py on boot")
+        if restarted:
+            print(f"  1. The device restarted and is running the new main.py")
+        else:
+            print(f"  1. Restart manually or the device will auto-run main.py on boot")
         print(f"  2. Connect to REPL: mpremote connect {port}")
         print(f"  3. Or run main.py: mpremote connect {port} run :main.py")
         